@@ -3,6 +3,7 @@
 # Handlers are created for writing to both a file and to the console.
 
 import logging
+import threading
 from logging import FileHandler, Formatter, Logger, LogRecord
 from datetime import datetime
 from contextlib import contextmanager
@@ -70,10 +71,16 @@ class ElapsedFormatter(Formatter):
             raise
 
 
+## Spinner lock
+# Only one spinner can be shown at a time, so tasks run from other threads while one is shown go without
+_spinner_lock: threading.Lock = threading.Lock()
+
+
 @contextmanager
 def with_spinner(description: str) -> Generator:
     """
     A reusable context manager that shows a spinner and logs status during long-running tasks.
+    If a spinner is already shown (e.g. by another thread), the task runs without one.
 
     Args
     ------------
@@ -87,17 +94,25 @@ def with_spinner(description: str) -> Generator:
     """
     try:
         logger.info(f"⚙️ Starting task: {description}")
-        # Create progress spinner
-        with Progress(
-            SpinnerColumn(),                                         # Shows a rotating spinner
-            TextColumn("[progress.description]{task.description}"),  # Task description
-            transient=True,                                          # Automatically removes when done
-        ) as progress:
-            task = progress.add_task(description)
-            # Yield control to the user's code
-            yield               
-            # Log completion after the task finishes
+        # Run without a spinner if one is already shown
+        if not _spinner_lock.acquire(blocking=False):
+            yield
             logger.info(f"✅ Completed task: {description}")
+            return
+        try:
+            # Create progress spinner
+            with Progress(
+                SpinnerColumn(),                                         # Shows a rotating spinner
+                TextColumn("[progress.description]{task.description}"),  # Task description
+                transient=True,                                          # Automatically removes when done
+            ) as progress:
+                task = progress.add_task(description)
+                # Yield control to the user's code
+                yield               
+                # Log completion after the task finishes
+                logger.info(f"✅ Completed task: {description}")
+        finally:
+            _spinner_lock.release()
     except Exception as e:
         logger.error(f"❌ Task failed: {description} - Error: {str(e)}")
         raise
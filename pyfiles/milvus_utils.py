@@ -5,9 +5,16 @@
 ## Imports
 # Third-party modules
 import time
-import pprint
-
-from pymilvus.client.search_result import SearchResult # type: ignore
+import json
+import logging
+import threading
+import grpc # type: ignore
+
+from pymilvus.client.search_result import ( # type: ignore
+    SearchResult, 
+    HybridHits
+)
+from pymilvus.grpc_gen.schema_pb2 import SearchResultData # type: ignore
 from pymilvus.milvus_client.index import IndexParams # type: ignore
 from pymilvus import ( # type: ignore
     MilvusClient, 
@@ -17,7 +24,11 @@ from pymilvus import ( # type: ignore
     DataType 
 )
 
-from typing import List
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Dict, List, Tuple
+from pydantic import BaseModel
 
 ## Internal modules
 from validators import milvus_types
@@ -31,21 +42,41 @@ from pyfiles.logger import (
 # URI | Milvus server uri
 uri: str = 'http://localhost:19530'
 
+## gRPC channel options
+# Options added to the gRPC channel of clients with compression, merged over the PyMilvus defaults
+# PyMilvus already pings idle connections, so only compression is set here
+# Text and sparse vectors compress well, which pays off on slow links but only costs CPU on localhost
+grpc_compression_options: Dict[str, Any] = {
+    'grpc.default_compression_algorithm': int(grpc.Compression.Gzip),
+}
+
+## Client cache
+# Connected Milvus clients for each URI and compression setting, reused by every `MilvusClientInit` in the process
+_client_cache: Dict[Tuple[str, bool], MilvusClient] = {}
+
+## BM25 search settings
+# Algorithm used to search BM25 sparse inverted indices
+# Block-Max WAND skips more of the posting lists than MaxScore for the short queries and small limits used here
+inverted_index_algo: str = 'DAAT_WAND'
+# Proportion of the smallest values to drop from the query vectors when searching
+drop_ratio_search: float = 0.2
+
 ## Index params list
 # List of dictionaries defining the indices to add to index params
 # Here, we're only working with sparse vectors created with BM25
-index_params_list: List[dict] = [
+# The `inverted_index_algo` of BM25 indices is set by the client (see `inverted_index_algo`)
+# Default arguments are tuples so they can't be changed between calls
+index_params_list: Tuple[dict, ...] = (
     {
         "field_name": "sparse",
         "index_type": "SPARSE_INVERTED_INDEX",
         "metric_type": "BM25",
         "params": {
-            "inverted_index_algo": "DAAT_MAXSCORE",
             "bm25_k1": 3,   # Maximize importance of term frequency
             "bm25_b": 1     # Full normalization of docs
         }
-    }
-]
+    },
+)
 
 ## BM25 embed function
 # The function to get sparse embeddings from text
@@ -60,7 +91,7 @@ func_bm25: Function = Function(
 # List of dictionaries defining the fields to add to the schema
 # This is how we describe our data:
 # just need text and sparse vectors for this demo (full-text search only)
-field_params_list: List[dict] = [
+field_params_list: Tuple[dict, ...] = (
     {
         "field_name": "id", 
         "datatype": DataType.INT64, 
@@ -77,29 +108,72 @@ field_params_list: List[dict] = [
         "field_name": "sparse", 
         "datatype": DataType.SPARSE_FLOAT_VECTOR
     }
-]
+)
 
 ## Collection name
 collection_name: str = 'collection_ex'
 
 ## Example data
 # Default data to use for the insert method
-data_ex: List[dict] = [
+data_ex: Tuple[dict, ...] = (
     {'text': 'information retrieval is a field of study.'},
     {'text': 'information retrieval focuses on finding relevant information in large datasets.'},
     {'text': 'data mining and information retrieval overlap in research.'},
     {'text': 'the rest of the lyrics go,'},
     {'text': 'Last night I dreamed about'}
-]
+)
 
 ## Query list
 # Default list of queries to search the database
-query_list: List[str] = ["What's the focus of information retrieval?"]
+query_list: Tuple[str, ...] = ("What's the focus of information retrieval?",)
 
 ## Result limit
 # Default maximum number of results to get from search
 lim_results: int = 3
 
+## Search fields
+# Only full-text so focus on sparse vectors built from text
+anns_field: str = 'sparse'
+output_fields: List[str] = ['text']
+
+## Collections cache TTL
+# Number of seconds for which the known collection names are reused before listing them again
+collections_cache_ttl: float = 5.0
+
+## Insert batch size
+# Default maximum number of rows to send in a single insert request
+insert_batch_size: int = 1000
+
+## Consistency level
+# Default consistency level of searches and new collections
+# Searches don't wait for the latest writes to be visible, skipping a sync with the server per search
+# Use 'Strong' to always see the latest writes
+consistency_level: str = 'Eventually'
+
+## Search batch size
+# Default maximum number of queries to send in a single search request
+search_batch_size: int = 64
+
+## Search workers
+# Default maximum number of batched search requests sent at the same time
+# The Milvus client is safe to share between threads, so batches can be sent over the same connection concurrently
+search_max_workers: int = 4
+
+## Results cache size
+# Default maximum number of query results cached by each client for `full_text_search`
+# Use 0 to disable the cache
+results_cache_size: int = 1024
+
+## Results cache TTL
+# Number of seconds for which cached query results are reused before searching again
+# Writes through other clients or processes don't clear the cache, so results are only trusted for a short time
+results_cache_ttl: float = 60.0
+
+## Results cache write window
+# Number of seconds after a write through a client during which its 'Eventually' search results aren't cached
+# Data written shortly before may not be searchable yet, so those results may be missing it
+results_cache_write_window: float = 5.0
+
 
 
 class MilvusClientInit:
@@ -180,6 +254,12 @@ class MilvusClientInit:
     lim_results = 3
     client.full_text_search(name=name, query_list=query_list, limit=limit)
     ```
+
+    Clients initialized for the same URI share a single connection to the Milvus server.
+    To close all the connections when you're done:
+    ```python
+    MilvusClientInit.shutdown()
+    ```
     
     Attributes
     ------------
@@ -188,11 +268,42 @@ class MilvusClientInit:
             Defaults to 'http://localhost:19530'.
         client: MilvusClient
             The Milvus client to use to manage and query data.
+        inverted_index_algo: str, Optional
+            The algorithm used to search the BM25 indices created by this client.
+            Defaults to 'DAAT_WAND'.
+        drop_ratio_search: float, Optional
+            The proportion of the smallest values to drop from the query vectors when searching.
+            Defaults to 0.2.
+        results_cache_size: int, Optional
+            The maximum number of query results cached for `full_text_search`.
+            The cache belongs to this instance, even when the `MilvusClient` is shared with other instances for the same URI.
+            Defaults to 1024.
+        compression: bool, Optional
+            Whether the connection to the Milvus server is compressed with gzip.
+            Defaults to False.
+        _collections_cache: set[str] | None
+            The collection names from the last time the collections were listed.
+        _collections_cache_ts: float
+            The `time.monotonic` timestamp of the last time the collections were listed.
+        _search_params: dict
+            The search params sent with every search request.
+        _results_cache: OrderedDict[Tuple[str, str, int, str], Tuple[float, HybridHits]]
+            The `time.monotonic` timestamp and results of the most recently searched queries, keyed by collection name, query, limit, and consistency level.
+        _results_cache_lock: threading.Lock
+            The lock held for every read and write of `_results_cache`, `_write_counts`, and `_write_ts`, so they can be used from several threads.
+        _write_counts: Dict[str, int]
+            The number of writes through this client to each collection, used to skip caching results searched during a write.
+        _write_ts: Dict[str, float]
+            The `time.monotonic` timestamp of the last write through this client to each collection.
     """
     def __init__(
         self, 
         uri: str = uri,
-        client: MilvusClient | None = None
+        client: MilvusClient | None = None,
+        inverted_index_algo: str = inverted_index_algo,
+        drop_ratio_search: float = drop_ratio_search,
+        results_cache_size: int = results_cache_size,
+        compression: bool = False
     ) -> None:
         """
         Initialize the Milvus client hosted on the given URI.
@@ -202,6 +313,25 @@ class MilvusClientInit:
             uri: str, Optional
                 The uri on which to host the Milvus client.
                 Defaults to 'http://localhost:19530'.
+            client: MilvusClient, Optional
+                An already connected Milvus client to use instead of connecting a new one.
+            inverted_index_algo: str, Optional
+                The algorithm used to search the BM25 indices created by this client.
+                One of 'DAAT_WAND', 'DAAT_MAXSCORE', or 'TAAT_NAIVE'.
+                Defaults to 'DAAT_WAND'.
+            drop_ratio_search: float, Optional
+                The proportion of the smallest values to drop from the query vectors when searching.
+                Higher values are faster but can miss relevant results.
+                Defaults to 0.2.
+            results_cache_size: int, Optional
+                The maximum number of query results cached for `full_text_search`.
+                The least recently used results are dropped first.
+                Use 0 to disable the cache.
+                Defaults to 1024.
+            compression: bool, Optional
+                Whether to gzip the requests and responses of the connection.
+                Only worth it when the Milvus server is reached over a slow network.
+                Defaults to False.
             
         Raises
         ------------
@@ -209,13 +339,37 @@ class MilvusClientInit:
                 If initialization fails, error is logged and raised.
         """
         ## Validate all argument types
-        milvus_types.InitClientParams(
-            uri = uri
+        self._validate(
+            milvus_types.InitClientParams,
+            uri = uri,
+            inverted_index_algo = inverted_index_algo,
+            drop_ratio_search = drop_ratio_search,
+            results_cache_size = results_cache_size,
+            compression = compression
         )
 
         ## Start Init
         try:
             self.uri = uri
+            self.inverted_index_algo = inverted_index_algo
+            self.drop_ratio_search = drop_ratio_search
+            self.results_cache_size = results_cache_size
+            self.compression = compression
+            # Search params only depend on the client settings, so they're built once
+            # Controls trade-off between speed and accuracy in ANN searches
+            self._search_params: dict = {
+                'params': {'drop_ratio_search': drop_ratio_search},
+            }
+            # Query results are cached to skip searching again for repeated queries
+            self._results_cache: OrderedDict[Tuple[str, str, int, str], Tuple[float, HybridHits]] = OrderedDict()
+            # Searches, inserts, and drops can run in several threads, which all reorder or change the cache
+            self._results_cache_lock = threading.Lock()
+            # Writes are tracked per collection, so results that may be missing the written data aren't cached
+            self._write_counts: Dict[str, int] = {}
+            self._write_ts: Dict[str, float] = {}
+            # Collection names are cached to skip listing them for every existence check
+            self._collections_cache: set[str] | None = None
+            self._collections_cache_ts: float = 0.0
             # Initialize MilvusClient from PyMilvus
             if client is None:
                 self.client: MilvusClient = self._init_client()
@@ -236,6 +390,7 @@ class MilvusClientInit:
     ) -> MilvusClient:
         """
         Connect the Milvus client.
+        If a client is already connected for the URI with the same compression setting, it is reused instead of opening a new connection.
         
         Returns
         ------------
@@ -247,11 +402,19 @@ class MilvusClientInit:
             Exception: 
                 If client connection fails, error is logged and raised.
         """
+        ## Reuse the client for this URI if one is already connected
+        cache_key: Tuple[str, bool] = (self.uri, self.compression)
+        if cache_key in _client_cache:
+            logger.info(f'⚙️ Reusing Milvus client connected at `{self.uri}`')
+            return _client_cache[cache_key]
+
         logger.info(f'⚙️ Starting Milvus client on URI `{self.uri}`')
         try:
             ## Define MilvusClient with PyMilvus library
+            options: Dict[str, Any] = grpc_compression_options if self.compression else {}
             client: MilvusClient = MilvusClient(
-                uri=self.uri
+                uri=self.uri,
+                grpc_options=options
             )
             
             ## Validate results
@@ -259,7 +422,8 @@ class MilvusClientInit:
                 results=client
             )
 
-            ## Return results
+            ## Cache and return results
+            _client_cache[cache_key] = client
             logger.info(f'⚙️ Milvus client connected at `{self.uri}`')
             return client
         except Exception as e:
@@ -267,6 +431,66 @@ class MilvusClientInit:
             raise
 
 
+    # Close all cached MilvusClients
+    @classmethod
+    def shutdown(
+        cls
+    ) -> None:
+        """
+        Close the connections of all the Milvus clients shared between `MilvusClientInit` instances.
+        New instances will open a new connection.
+
+        For example, to close all connections at the end of a script:
+        ```python
+        client = MilvusClientInit()
+        client.list_collections()
+        MilvusClientInit.shutdown()
+        ```
+            
+        Raises
+        ------------
+            Exception: 
+                If closing a client fails, error is logged and raised.
+        """
+        try:
+            while _client_cache:
+                (uri, _), client = _client_cache.popitem()
+                client.close()
+                logger.info(f'⚙️ Closed Milvus client connected at `{uri}`')
+        except Exception as e:
+            logger.error(f'❌ Problem closing Milvus client: `{str(e)}`')
+            raise
+
+
+    # Validate the arguments of a method
+    @staticmethod
+    def _validate(
+        model: type[BaseModel],
+        **kwargs: Any
+    ) -> None:
+        """
+        Validate the arguments of a method with the given model.
+        The validators only raise, so the error is logged here once for every method.
+
+        Args
+        ------------
+            model: type[BaseModel]
+                The model from `validators.milvus_types` with the expected argument types.
+            **kwargs: Any
+                The arguments to validate.
+            
+        Raises
+        ------------
+            ValueError, TypeError: 
+                If an argument is invalid, error is logged and raised.
+        """
+        try:
+            model(**kwargs)
+        except (TypeError, ValueError) as e:
+            logger.error(f'❌ Invalid arguments for `{model.__name__}`: {str(e)}')
+            raise
+
+
     # Create field for schema
     def _create_field(
         self, 
@@ -290,13 +514,14 @@ class MilvusClientInit:
                 If adding the field fails, error is logged and raised.
         """
         ## Validate all argument types
-        milvus_types.CreateFieldParams(
-            collection_schema=schema,
-            params=params
-        )
+        # Plain checks since this runs for every field of `create_collection`
+        milvus_types.check_type(schema, CollectionSchema, 'schema')
+        milvus_types.check_type(params, dict, 'params')
 
         ## Start Create Field
-        logger.info(f'⚙️ Creating field for params: \n {pprint.pformat(params, indent=0, width=500)} \n')
+        # Only format the params when they'll be logged
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f'⚙️ Creating field for params: \n {json.dumps(params, default=str)} \n')
         try:
             # Add the field to the schema for the given params
             schema.add_field(**params)
@@ -314,6 +539,7 @@ class MilvusClientInit:
     ) -> None:
         """
         Add an index with the given parameters to the given list of index parameters.
+        BM25 indices use the search algorithm of the client unless `inverted_index_algo` is given in their params.
 
         Args
         ------------
@@ -329,13 +555,25 @@ class MilvusClientInit:
                 If adding the index fails, error is logged and raised.
         """
         ## Validate all argument types
-        milvus_types.CreateIndexParams(
-            index_params=index_params,
-            params=params
-        )
+        # Plain checks since this runs for every index of `create_collection`
+        milvus_types.check_type(index_params, IndexParams, 'index_params')
+        milvus_types.check_type(params, dict, 'params')
+
+        ## Set the search algorithm of BM25 indices
+        # A new dictionary is built so the given params aren't modified
+        if params.get('metric_type') == 'BM25':
+            params = {
+                **params,
+                'params': {
+                    'inverted_index_algo': self.inverted_index_algo,
+                    **params.get('params', {})
+                }
+            }
 
         ## Start Create Index
-        logger.info(f'⚙️ Creating index for params: \n {pprint.pformat(params, indent=0, width=500)} \n')
+        # Only format the params when they'll be logged
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f'⚙️ Creating index for params: \n {json.dumps(params, default=str)} \n')
         try:
             # Add the index to the index params for the given params
             index_params.add_index(**params)
@@ -348,7 +586,7 @@ class MilvusClientInit:
     ## List all client collections
     def list_collections(
         self
-    ) -> List[str | None]:
+    ) -> List[str]:
         """
         Get all collections for the client.
 
@@ -364,7 +602,7 @@ class MilvusClientInit:
 
         Returns
         ------------
-            List[str | None]: 
+            List[str]: 
                 A list of the names of all available collections.
             
         Raises
@@ -381,21 +619,118 @@ class MilvusClientInit:
                 results=collections
             )
 
+            ## Update the collections cache
+            self._collections_cache = set(collections)
+            self._collections_cache_ts = time.monotonic()
+
             ## Return results
-            logger.info(f'📝 Available collections: \n {pprint.pformat(collections, indent=0, width=500)} \n')
+            # Only format the collections when they'll be logged
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f'📝 Available collections: \n {json.dumps(collections, default=str)} \n')
             return collections
         except Exception as e:
             logger.error(f'❌ Problem listing collections: `{str(e)}`')
             raise   
 
 
+    ## Check if a collection exists
+    def has_collection(
+        self, 
+        name: str = collection_name
+    ) -> bool:
+        """
+        Check if a collection with the given name exists.
+
+        Only the given collection is looked up on the Milvus server, so this is cheaper than listing all collections.
+
+        For example, to check if a collection exists after creating it:
+        ```python
+        # Initialize the client
+        uri = 'http://localhost:19530'
+        client = MilvusClientInit(uri=uri)
+
+        # Create a collection
+        name = 'collection_ex'
+        client.create_collection(name=name)
+
+        # Check the collection exists
+        client.has_collection(name=name)
+        ```
+
+        Args
+        ------------
+            name: str
+                The name of the collection to look up.
+
+        Returns
+        ------------
+            bool: 
+                Whether the collection exists.
+            
+        Raises
+        ------------
+            Exception: 
+                If checking the collection fails, error is logged and raised.
+        """
+        ## Validate all argument types
+        self._validate(
+            milvus_types.HasCollectionParams,
+            name=name
+        )
+
+        try:
+            ## Check the collection on the Milvus server
+            exists = self.client.has_collection(collection_name=name)
+
+            ## Update the collections cache
+            # The cache is read once, since a failure in another thread may clear it at any time
+            collections = self._collections_cache
+            if collections is not None:
+                if exists:
+                    collections.add(name)
+                else:
+                    collections.discard(name)
+
+            logger.info(f'📝 Collection `{name}` exists: {exists}')
+            return exists
+        except Exception as e:
+            logger.error(f'❌ Problem checking collection `{name}`: `{str(e)}`')
+            raise   
+
+
+    ## Get the cached collection names
+    def _collections(
+        self
+    ) -> set[str]:
+        """
+        Get the names of all collections for the client, reusing the last listed names if they were listed less than `collections_cache_ttl` seconds ago.
+
+        This is used to check if a collection exists without sending a request to the Milvus server on every call.
+        The cache is refreshed every time `list_collections` is called, and is updated in place when a collection is created or dropped through this client.
+
+        Returns
+        ------------
+            set[str]: 
+                A set of the names of all available collections.
+        """
+        # The cache is read once, since a failure in another thread may clear it at any time
+        collections = self._collections_cache
+        if (
+            collections is None
+            or time.monotonic() - self._collections_cache_ts >= collections_cache_ttl
+        ):
+            collections = set(self.list_collections())
+        return collections
+
+
     ## Create a collection for the client
     def create_collection(
         self, 
         name: str = collection_name, 
-        field_params_list: List[dict] = field_params_list, 
-        func_list: List[Function] = [func_bm25], 
-        index_params_list: List[dict] = index_params_list,
+        field_params_list: List[dict] | Tuple[dict, ...] = field_params_list, 
+        func_list: List[Function] | Tuple[Function, ...] = (func_bm25,), 
+        index_params_list: List[dict] | Tuple[dict, ...] = index_params_list,
+        consistency_level: str = consistency_level
     ) -> None:
         """
         Create a collection with the given name, field parameters, embedding functions, and index parameters.
@@ -500,6 +835,10 @@ class MilvusClientInit:
                         output_field_names=["sparse"],
                         function_type=FunctionType.BM25,
                     ) 
+            consistency_level: str, Optional
+                Default consistency level of searches on the collection.
+                One of 'Strong', 'Bounded', 'Session', or 'Eventually'.
+                Defaults to 'Eventually'.
             
         Raises
         ------------
@@ -507,16 +846,17 @@ class MilvusClientInit:
                 If creating the collection fails, error is logged and raised.
         """
         ## Validate all argument types
-        milvus_types.CreateCollectionParams(
+        self._validate(
+            milvus_types.CreateCollectionParams,
             name=name,
             field_params_list=field_params_list,
             func_list=func_list,
-            index_params_list=index_params_list
+            index_params_list=index_params_list,
+            consistency_level=consistency_level
         )
 
         ## Check if collection already exists
-        collections: List[str | None] = self.list_collections()
-        if name in collections:
+        if name in self._collections():
             logger.info(f'✅ Collections `{name}` already exists.')
             return
 
@@ -549,19 +889,20 @@ class MilvusClientInit:
             self.client.create_collection(
                 collection_name=name,
                 schema=schema,
-                index_params=index_params
+                index_params=index_params,
+                consistency_level=consistency_level
             )
 
-            ## List collections
-            # Make sure collection was added properly
-            collections = self.list_collections()
-            if name in collections:
-                logger.info(f'✅ Created collection `{name}`')
-            else:
-                error_message = f"The new collection `name` is not in the collections list."
-                logger.error(error_message)
-                raise ValueError(error_message)
+            ## Update the collections cache
+            # The Milvus server raises if the collection isn't created, so there's no need to list the collections again
+            # The cache is read once, since a failure in another thread may clear it at any time
+            collections = self._collections_cache
+            if collections is not None:
+                collections.add(name)
+            logger.info(f'✅ Created collection `{name}`')
         except Exception as e:
+            # The collections on the server are unknown, so list them again on the next check
+            self._collections_cache = None
             logger.error(f'❌ Problem creating collection `{name}`: `{str(e)}`')
             raise   
 
@@ -599,13 +940,13 @@ class MilvusClientInit:
                 If dropping the collection fails, error is logged and raised.
         """
         ## Validate all argument types
-        milvus_types.DropCollectionParams(
+        self._validate(
+            milvus_types.DropCollectionParams,
             name=name
         )
 
         ## Check that collection exists
-        collections: List[str | None] = self.list_collections()
-        if name not in collections:
+        if name not in self._collections():
             logger.info(f'❌ Cannot find collection `{name}`.')
             return
 
@@ -613,16 +954,17 @@ class MilvusClientInit:
         logger.info(f'⚙️ Dropping collection `{name}`')
         try:
             # Drop collection
+            # The Milvus server raises if the collection isn't dropped, so there's no need to list the collections again
             self.client.drop_collection(collection_name=name)
-            # Make sure collection was dropped
-            collections = self.list_collections()
-            if name not in collections:
-                logger.info(f'✅ Dropped collection `{name}`')
-            else:
-                error_message = f"The collection `name` is still in the collections list."
-                logger.error(error_message)
-                raise ValueError(error_message)
+            # The cache is read once, since a failure in another thread may clear it at any time
+            collections = self._collections_cache
+            if collections is not None:
+                collections.discard(name)
+            self._clear_results_cache(name)
+            logger.info(f'✅ Dropped collection `{name}`')
         except Exception as e:
+            # The collections on the server are unknown, so list them again on the next check
+            self._collections_cache = None
             logger.error(f'❌ Problem dropping collection: `{str(e)}`')
             raise  
 
@@ -631,10 +973,15 @@ class MilvusClientInit:
     def insert(
         self, 
         name: str = collection_name, 
-        data: List[dict] = data_ex
+        data: List[dict] | Tuple[dict, ...] | Dict[str, list] = data_ex,
+        wait_for_flush: bool = False,
+        batch_size: int = insert_batch_size,
+        deduplicate: bool = False
     ) -> dict | None:
         """
         Insert the given data into the given collection.
+        The data is sent `batch_size` rows at a time, so large lists don't make for oversized requests.
+        The data can be given as a list of rows or as a dictionary of columns.
 
         For example, to insert data into a given collection:
         ```python
@@ -655,19 +1002,36 @@ class MilvusClientInit:
             {'text': 'Last night I dreamed about'}
         ]
         client.insert(name=name, data=data)
+
+        # Or insert the same data as columns
+        columns = {'text': [row['text'] for row in data]}
+        client.insert(name=name, data=columns)
         ```
 
         Args
         ------------
             name: str
                 Name of the collection to insert the data into.
-            data: List[dict]
+            data: List[dict] | Dict[str, list]
                 The data to insert into the collection.
+                Either a list of rows, or a dictionary mapping each field name to a list of values of the same length.
+            wait_for_flush: bool, Optional
+                Whether to wait for the Milvus server to flush the inserted data before returning.
+                Only needed when the data must be persisted right away.
+                Defaults to False.
+            batch_size: int, Optional
+                Maximum number of rows to send in a single insert request.
+                Defaults to 1000.
+            deduplicate: bool, Optional
+                Whether to skip rows with the same `text` as an earlier row, keeping duplicates out of the BM25 index.
+                Rows without a `text` field are always inserted.
+                Defaults to False.
 
         Returns
         ------------
             dict: 
                 A dictionary of the data added to the collection.
+                When the data is sent in several batches, the `insert_count` and `ids` of all batches are merged.
             
         Raises
         ------------
@@ -675,27 +1039,65 @@ class MilvusClientInit:
                 If adding the data fails, error is logged and raised.
         """
         ## Validate all argument types
-        milvus_types.InsertParams(
+        self._validate(
+            milvus_types.InsertParams,
             name=name,
-            data=data
+            data=data,
+            wait_for_flush=wait_for_flush,
+            batch_size=batch_size,
+            deduplicate=deduplicate
         )
 
         ## Check that collection exists
-        collections = self.list_collections()
-        if name not in collections:
+        if name not in self._collections():
             logger.info(f'❌ Cannot find collection `{name}`.')
             return None
 
         ## Start Insert
         logger.info(f'⚙️ Inserting data into `{name}`')
         try:
-            # Insert data into the collection
-            results: dict = self.client.insert(
-                collection_name=name,
-                data=data
-            )
-            # Wait for the database to update
-            time.sleep(0.5)
+            ## Convert columns to rows
+            # The Milvus client only takes rows, so the columns are zipped into rows once
+            if isinstance(data, dict):
+                fields: List[str] = list(data)
+                data = [dict(zip(fields, values)) for values in zip(*data.values())]
+
+            ## Skip rows with text that was already seen
+            if deduplicate:
+                seen: set[str] = set()
+                rows: List[dict] = []
+                for row in data:
+                    text = row.get('text')
+                    if text is None:
+                        rows.append(row)
+                    elif text not in seen:
+                        seen.add(text)
+                        rows.append(row)
+                if len(rows) < len(data):
+                    logger.info(f'📝 Skipping {len(data) - len(rows)} duplicate rows')
+                data = rows
+
+            ## Insert data into the collection one batch at a time
+            batch_results: List[dict] = [
+                self.client.insert(
+                    collection_name=name,
+                    data=list(data[i:i + batch_size])
+                )
+                for i in range(0, max(len(data), 1), batch_size)
+            ]
+            # Merge the results if the data was split into several batches
+            if len(batch_results) == 1:
+                results: dict = batch_results[0]
+            else:
+                results = {
+                    'insert_count': sum(batch.get('insert_count', 0) for batch in batch_results),
+                    'ids': [id for batch in batch_results for id in batch.get('ids', [])]
+                }
+            # Cached results may be missing the new data
+            self._clear_results_cache(name)
+            # Wait for the database to persist the data if asked to
+            if wait_for_flush:
+                self.client.flush(collection_name=name)
             logger.info(f'✅ Inserted data')
 
             ## Validate results types
@@ -710,11 +1112,110 @@ class MilvusClientInit:
             raise
 
 
+    ## Insert data from a JSON Lines file into a collection
+    def insert_from_jsonl(
+        self, 
+        path: str,
+        name: str = collection_name, 
+        batch_size: int = insert_batch_size,
+        wait_for_flush: bool = False
+    ) -> dict | None:
+        """
+        Insert the data in the given JSON Lines file into the given collection.
+        Each line of the file is one row of data, for example `{"text": "information retrieval is a field of study."}`.
+        The file is read lazily and inserted `batch_size` rows at a time, so the whole file is never held in memory.
+
+        For example, to insert a dataset written by `scripts.generate_dataset.write_dataset`:
+        ```python
+        # Initialize the client
+        uri = 'http://localhost:19530'
+        client = MilvusClientInit(uri=uri)
+
+        # Create a collection
+        name = 'collection_ex'
+        client.create_collection(name=name)
+
+        # Insert the data 1000 rows at a time
+        client.insert_from_jsonl(path='dataset.jsonl', name=name, batch_size=1000)
+        ```
+
+        Args
+        ------------
+            path: str
+                Path of the JSON Lines file with the data to insert.
+            name: str
+                Name of the collection to insert the data into.
+            batch_size: int, Optional
+                Maximum number of rows to send in a single insert request.
+                Defaults to 1000.
+            wait_for_flush: bool, Optional
+                Whether to wait for the Milvus server to flush the inserted data before returning.
+                Defaults to False.
+
+        Returns
+        ------------
+            dict: 
+                A dictionary with the total number of rows inserted into the collection.
+            
+        Raises
+        ------------
+            Exception: 
+                If reading or adding the data fails, error is logged and raised.
+        """
+        ## Validate all argument types
+        self._validate(
+            milvus_types.InsertFromJsonlParams,
+            path=path,
+            name=name,
+            batch_size=batch_size,
+            wait_for_flush=wait_for_flush
+        )
+
+        ## Check that collection exists
+        if name not in self._collections():
+            logger.info(f'❌ Cannot find collection `{name}`.')
+            return None
+
+        ## Start Insert From JSON Lines
+        logger.info(f'⚙️ Inserting data from `{path}` into `{name}`')
+        try:
+            insert_count: int = 0
+            with open(path, encoding='UTF-8') as file:
+                # Read the rows lazily, skipping blank lines
+                rows = (json.loads(line) for line in file if line.strip())
+                # Insert one batch of rows at a time
+                while batch := list(islice(rows, batch_size)):
+                    batch_results: dict = self.client.insert(
+                        collection_name=name,
+                        data=batch
+                    )
+                    insert_count += batch_results.get('insert_count', 0)
+            # Cached results may be missing the new data
+            self._clear_results_cache(name)
+            # Wait for the database to persist the data if asked to
+            if wait_for_flush:
+                self.client.flush(collection_name=name)
+            logger.info(f'✅ Inserted {insert_count} rows')
+
+            ## Validate results types
+            results: dict = {'insert_count': insert_count}
+            milvus_types.InsertResults(
+                results=results
+            )
+
+            ## Return results
+            return results
+        except Exception as e:
+            logger.error(f'❌ Problem inserting data from `{path}`: {str(e)}')
+            raise
+
+
     ## Delete data from a collection
     def delete(
         self, 
         ids: List[str],
         name: str = collection_name, 
+        wait_for_flush: bool = False
     ) -> None:
         """
         Delete the given data from the given collection.
@@ -729,10 +1230,13 @@ class MilvusClientInit:
 
         Args
         ------------
-            data: List[str]
+            ids: List[str]
                 A list of ids to delete from the collection.
             name: str
-                Name of the collection to upsert the data into.
+                Name of the collection to delete the data from.
+            wait_for_flush: bool, Optional
+                Whether to wait for the Milvus server to flush the deletion before returning.
+                Defaults to False.
             
         Raises
         ------------
@@ -740,27 +1244,31 @@ class MilvusClientInit:
                 If deleting the data fails, error is logged and raised.
         """
         ## Validate all argument types
-        milvus_types.DeleteParams(
+        self._validate(
+            milvus_types.DeleteParams,
             name=name,
-            ids=ids
+            ids=ids,
+            wait_for_flush=wait_for_flush
         )
 
         ## Check that collection exists
-        collections = self.list_collections()
-        if name not in collections:
+        if name not in self._collections():
             logger.info(f'❌ Cannot find collection `{name}`.')
             return None
 
         ## Start Delete
         logger.info(f'⚙️ Deleting data from `{name}`')
         try:
-            # Delete data into the collection
+            # Delete data from the collection
             results: dict = self.client.delete(
                 collection_name=name,
                 ids=ids
             )
-            # Wait for the database to update
-            time.sleep(0.5)
+            # Cached results may include the deleted data
+            self._clear_results_cache(name)
+            # Wait for the database to persist the deletion if asked to
+            if wait_for_flush:
+                self.client.flush(collection_name=name)
             logger.info(f'✅ Deleted data')
         except Exception as e:
             logger.error(f'❌ Problem deleting data: {str(e)}')
@@ -771,12 +1279,21 @@ class MilvusClientInit:
     def full_text_search(
         self, 
         name: str = collection_name, 
-        query_list: List[str] = query_list, 
-        limit: int = lim_results
+        query_list: List[str] | Tuple[str, ...] = query_list, 
+        limit: int = lim_results,
+        consistency_level: str = consistency_level
     ) -> SearchResult | None:
         """
         Perform a full text search on the given collection for the queries in the given query list. 
         Get a maximum number of results given by the result limit.
+        All queries are sent in a single search request, so there's no need to call this method once per query.
+        For very long query lists, use `full_text_search_batched` instead.
+
+        The results of each query are cached, so only the queries that weren't searched recently are sent to the Milvus server.
+        The cache belongs to this instance: the cached results of a collection are cleared when data is inserted into or deleted from it through this instance, but not by writes through other instances or processes.
+        So cached results are only reused for `results_cache_ttl` seconds, and empty results are never cached.
+        Results searched while data is written through this instance aren't cached, and neither are 'Eventually' results searched within `results_cache_write_window` seconds after such a write.
+        Searches with the 'Strong' consistency level always go to the Milvus server.
 
         For example to search a collection for a given list of queries:
         ```python
@@ -812,11 +1329,17 @@ class MilvusClientInit:
                 List of queries to perform.
             limit: int
                 Maximum number of results to obtain.
+            consistency_level: str, Optional
+                Consistency level of the search.
+                Use 'Strong' to make sure the latest inserted data is searched.
+                Defaults to 'Eventually'.
 
         Returns
         ------------
-            List[dict]: 
-                A list of the search results for the given queries.
+            SearchResult | None: 
+                The search results for the given queries, with one `HybridHits` per query in the same order as `query_list`.
+                When some queries are served from the results cache, the `SearchResult` is rebuilt from the cached and searched `HybridHits`.
+                None if the collection doesn't exist.
             
         Raises
         ------------
@@ -824,53 +1347,306 @@ class MilvusClientInit:
                 If performing the search fails, error is logged and raised.
         """
         ## Validate all argument types
-        milvus_types.FullTextSearchParams(
+        self._validate(
+            milvus_types.FullTextSearchParams,
             name=name,
             query_list=query_list,
-            limit=limit
+            limit=limit,
+            consistency_level=consistency_level
         )
 
         ## Check that collection exists
-        collections = self.list_collections()
-        if name not in collections:
+        if name not in self._collections():
             logger.info(f'❌ Cannot find collection `{name}`.')
             return None
 
         ## Start Full Text Search
-        logger.info(f'⚙️ Performing search on `{name}` for queries: \n {pprint.pformat(query_list, indent=0, width=500)} \n')
+        # Only format the queries when they'll be logged
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f'⚙️ Performing search on `{name}` for queries: \n {json.dumps(query_list, default=str)} \n')
         try:
-            ## Define search params
-            # Only full-text so focus on sparse vectors built from text
-            anns_field: str = 'sparse'
-            output_fields: List[str] = ['text']
+            ## Get the cached results
+            keys: List[Tuple[str, str, int, str]] = [
+                (name, query, limit, consistency_level) for query in query_list
+            ]
+            found: Dict[Tuple[str, str, int, str], HybridHits] = {}
+            # Strong searches must see the latest data, so they never use the cache
+            use_cache: bool = consistency_level != 'Strong'
+            write_count: int = 0
+            if use_cache:
+                now: float = time.monotonic()
+                with self._results_cache_lock:
+                    # Results are only cached if no data is written to the collection while searching
+                    write_count = self._write_counts.get(name, 0)
+                    for key in keys:
+                        entry = self._results_cache.get(key)
+                        if entry is None:
+                            continue
+                        # Results older than the TTL may miss data written through other clients
+                        if now - entry[0] >= results_cache_ttl:
+                            del self._results_cache[key]
+                            continue
+                        self._results_cache.move_to_end(key)
+                        found[key] = entry[1]
+
+            ## Get the search results for the other queries
+            # All missing queries are sent in a single request
+            misses: List[str] = list(dict.fromkeys(
+                query for query, key in zip(query_list, keys) if key not in found
+            ))
+            if found:
+                logger.info(f'🔎 Using cached results for {len(found)} queries')
+            results: SearchResult | None = None
+            if misses:
+                with with_spinner(description=f"🔎 Getting results..."):
+                    searched: SearchResult = self._search(
+                        name=name,
+                        query_list=misses,
+                        limit=limit,
+                        consistency_level=consistency_level
+                    )
+                for query, hits in zip(misses, searched):
+                    key = (name, query, limit, consistency_level)
+                    found[key] = hits
+                    if use_cache:
+                        self._cache_results(key, hits, write_count)
+                # Nothing to reorder if every query was searched
+                if len(misses) == len(query_list):
+                    results = searched
+
+            ## Put the results back in the order of the queries
+            if results is None:
+                results = SearchResult(SearchResultData())
+                results.extend(found[key] for key in keys)
 
-            ## Add extra search params
-            # Controls trade-off between speed and accuracy in ANN searches
-            # Drop some percentage of results before searching
-            search_params: dict = {
-                'params': {'drop_ratio_search': 0.2},
-            }
-            with with_spinner(description=f"🔎 Getting results..."):
-                ## Get the search results
-                results: List[dict] = self.client.search(
-                    collection_name=name, 
-                    data=query_list,
-                    anns_field=anns_field,
-                    output_fields=output_fields,
+            ## Validate results types
+            milvus_types.FullTextSearchResults(
+                results=results
+            )
+
+            ## Return results
+            logger.info(f'📝 Got {sum(map(len, results))} results for {len(query_list)} queries')
+            # Each hit is only formatted when debugging, since formatting every hit can take longer than the search
+            if logger.isEnabledFor(logging.DEBUG):
+                for i, result in enumerate(results):
+                    for j, hit in enumerate(result):
+                        logger.debug(f'📝 Result {i}, {j}: \n {json.dumps(hit, default=str)} \n')
+            return results
+        except Exception as e:
+            logger.error(f'❌ Problem performing search: {str(e)}')
+            raise
+
+
+    ## Perform a full text search on a collection in batches of queries
+    def full_text_search_batched(
+        self, 
+        name: str = collection_name, 
+        query_list: List[str] | Tuple[str, ...] = query_list, 
+        limit: int = lim_results,
+        batch_size: int = search_batch_size,
+        consistency_level: str = consistency_level,
+        max_workers: int = search_max_workers
+    ) -> SearchResult | None:
+        """
+        Perform a full text search on the given collection for an arbitrarily long list of queries.
+        The queries are split into batches of at most `batch_size` queries, and each batch is sent in a single search request.
+        Up to `max_workers` batches are sent at the same time, so the server can work on several batches at once.
+        Get a maximum number of results per query given by the result limit.
+
+        For example to search a collection for a large list of queries:
+        ```python
+        # Initialize the client
+        uri = 'http://localhost:19530'
+        client = MilvusClientInit(uri=uri)
+
+        # Query the data 64 queries at a time
+        query_list: List[str] = [f'query {i}' for i in range(1000)]
+        client.full_text_search_batched(name='collection_ex', query_list=query_list, limit=3, batch_size=64)
+        ```
+
+        Args
+        ------------
+            name: str
+                Name of the collection to query.
+            query_list: List[str]
+                List of queries to perform.
+            limit: int
+                Maximum number of results to obtain for each query.
+            batch_size: int
+                Maximum number of queries to send in a single search request.
+                Defaults to 64.
+            consistency_level: str, Optional
+                Consistency level of the searches.
+                Defaults to 'Eventually'.
+            max_workers: int, Optional
+                Maximum number of search requests to send at the same time.
+                Use 1 to send the batches one after the other.
+                Defaults to 4.
+
+        Returns
+        ------------
+            SearchResult: 
+                The search results for all the given queries, in the same order as `query_list`.
+            
+        Raises
+        ------------
+            Exception: 
+                If performing the search fails, error is logged and raised.
+        """
+        ## Validate all argument types
+        self._validate(
+            milvus_types.FullTextSearchBatchedParams,
+            name=name,
+            query_list=query_list,
+            limit=limit,
+            batch_size=batch_size,
+            consistency_level=consistency_level,
+            max_workers=max_workers
+        )
+
+        ## Check that collection exists
+        if name not in self._collections():
+            logger.info(f'❌ Cannot find collection `{name}`.')
+            return None
+
+        ## Start Batched Full Text Search
+        # Always send at least one request, even for an empty query list
+        batches: List[List[str]] = [
+            list(query_list[i:i + batch_size]) for i in range(0, max(len(query_list), 1), batch_size)
+        ]
+        logger.info(f'⚙️ Performing search on `{name}` for {len(query_list)} queries in {len(batches)} batches')
+        try:
+            ## Get the search results for each batch
+            # Batches are sent concurrently, and `map` keeps the results in the order of the batches
+            def search_batch(batch: List[str]) -> SearchResult:
+                return self._search(
+                    name=name,
+                    query_list=batch,
                     limit=limit,
-                    search_params=search_params
+                    consistency_level=consistency_level
                 )
-            
+            with with_spinner(description=f"🔎 Getting results..."):
+                if len(batches) == 1 or max_workers == 1:
+                    batch_results: List[SearchResult] = list(map(search_batch, batches))
+                else:
+                    with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as executor:
+                        batch_results = list(executor.map(search_batch, batches))
+
+            # Extend the first batch results so the `SearchResult` type is kept
+            results: SearchResult = batch_results[0]
+            for batch_result in batch_results[1:]:
+                results.extend(batch_result)
+
             ## Validate results types
             milvus_types.FullTextSearchResults(
                 results=results
             )
 
             ## Return results
-            for i, result in enumerate(results):
-                for j, hit in enumerate(result):
-                    logger.info(f'📝 Result {i}, {j}: \n {pprint.pformat(hit, indent=0, width=500)} \n')
+            logger.info(f'📝 Got results for {len(results)} queries')
             return results
         except Exception as e:
-            logger.error(f'❌ Problem performing search: {str(e)}')
-            raise
\ No newline at end of file
+            logger.error(f'❌ Problem performing batched search: {str(e)}')
+            raise
+
+
+    ## Send a single search request for a list of queries
+    def _search(
+        self, 
+        name: str, 
+        query_list: List[str], 
+        limit: int,
+        consistency_level: str
+    ) -> SearchResult:
+        """
+        Send a single full text search request to the Milvus server for all the queries in the given query list.
+        No spinner is shown here since batches can be searched from several threads, so callers show it instead.
+
+        Args
+        ------------
+            name: str
+                Name of the collection to query.
+            query_list: List[str]
+                List of queries to send in the request.
+            limit: int
+                Maximum number of results to obtain for each query.
+            consistency_level: str
+                Consistency level of the search.
+
+        Returns
+        ------------
+            SearchResult: 
+                The search results for the given queries.
+        """
+        ## Get the search results
+        results: SearchResult = self.client.search(
+            collection_name=name, 
+            data=query_list,
+            anns_field=anns_field,
+            output_fields=output_fields,
+            limit=limit,
+            search_params=self._search_params,
+            consistency_level=consistency_level
+        )
+        return results
+
+
+    ## Cache the results of a query
+    def _cache_results(
+        self, 
+        key: Tuple[str, str, int, str], 
+        hits: HybridHits,
+        write_count: int
+    ) -> None:
+        """
+        Cache the results of a single query, dropping the least recently used results if the cache is full.
+        The results aren't cached if they may be missing data written through this client.
+
+        Args
+        ------------
+            key: Tuple[str, str, int, str]
+                The collection name, query, limit, and consistency level of the search.
+            hits: HybridHits
+                The search results for the query.
+            write_count: int
+                The number of writes to the collection when the search was sent.
+        """
+        # Empty results are most likely from a search sent before the data was searchable, so they aren't cached
+        if self.results_cache_size == 0 or len(hits) == 0:
+            return
+        name, consistency_level = key[0], key[3]
+        with self._results_cache_lock:
+            # Data written while searching may be missing from the results
+            if self._write_counts.get(name, 0) != write_count:
+                return
+            # 'Eventually' searches may not see data written shortly before yet
+            last_write: float | None = self._write_ts.get(name)
+            if consistency_level == 'Eventually' and last_write is not None:
+                if time.monotonic() - last_write < results_cache_write_window:
+                    return
+            self._results_cache[key] = (time.monotonic(), hits)
+            self._results_cache.move_to_end(key)
+            while len(self._results_cache) > self.results_cache_size:
+                self._results_cache.popitem(last=False)
+
+
+    ## Clear the cached results of a collection
+    def _clear_results_cache(
+        self, 
+        name: str
+    ) -> None:
+        """
+        Clear the cached query results for the given collection, and record the write to it.
+        This is called whenever the data of the collection is changed through this client.
+
+        Args
+        ------------
+            name: str
+                Name of the collection for which to clear the cached results.
+        """
+        with self._results_cache_lock:
+            for key in [key for key in self._results_cache if key[0] == name]:
+                del self._results_cache[key]
+            # Searches sent before this write must not cache their results
+            self._write_counts[name] = self._write_counts.get(name, 0) + 1
+            self._write_ts[name] = time.monotonic()
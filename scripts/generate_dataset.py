@@ -1,35 +1,45 @@
 
-from faker import Faker
-import statistics
-import time
+import os
+import json
+import pickle
+import random
+from statistics import fmean
 
-fake = Faker()
+# Number of words in the pool used to build paragraphs and queries
+word_pool_size = 10000
+
+def make_words(nb):
+    # Faker is slow to import, so only import it once words are needed
+    from faker import Faker
+    return Faker().words(nb=nb, unique=False)
+
+def make_sentence(words, nb_words):
+    # Assemble a sentence from random words of the pool
+    return ' '.join(random.choices(words, k=nb_words)).capitalize() + '.'
+
+def make_paragraph(words):
+    # Assemble a paragraph of 3 sentences
+    return ' '.join(make_sentence(words, random.randint(4, 8)) for _ in range(3))
 
 # Generate your dataset
 def generate_dataset(num_entries=1000, num_queries=100):
-    dataset = []
-    dataset_total_chars = 0
-    queries = []
-    queries_total_chars = 0
-    
-    for i in range(num_entries):
-        # Generate text content
-        text_content = fake.paragraph(nb_sentences=3)
-        # Store the entry
-        dataset.append({'text': text_content})
-        # Track character counts
-        char_count = len(text_content)
-        dataset_total_chars += char_count
-
-    # Generate realistic search queries
-    for i in range(num_queries):
-        query = fake.sentence(nb_words=5)  # 5-word sentences
-        queries.append(query)
-        char_count = len(query)
-        queries_total_chars += char_count
-
-    dataset_avg_chars =  dataset_total_chars / len(dataset)
-    queries_avg_chars = queries_total_chars / len(queries)
+    # Draw the words once instead of on every paragraph/sentence
+    words = make_words(word_pool_size)
+
+    # Generate text content | paragraphs of 3 sentences
+    dataset_texts = [make_paragraph(words) for _ in range(num_entries)]
+    dataset = [{'text': text} for text in dataset_texts]
+    # Track character counts
+    dataset_lengths = list(map(len, dataset_texts))
+
+    # Generate realistic search queries | 5-word sentences
+    queries = [make_sentence(words, 5) for _ in range(num_queries)]
+    queries_lengths = list(map(len, queries))
+
+    dataset_total_chars = sum(dataset_lengths)
+    queries_total_chars = sum(queries_lengths)
+    dataset_avg_chars = fmean(dataset_lengths) if dataset_lengths else 0.0
+    queries_avg_chars = fmean(queries_lengths) if queries_lengths else 0.0
 
     data = {
         "dataset": {
@@ -46,15 +56,57 @@ def generate_dataset(num_entries=1000, num_queries=100):
     
     return data
 
-# Generate
-data = generate_dataset(1000)
+# Directory where generated datasets are cached between runs
+dataset_cache_dir = '.cache'
+
+# Load a generated dataset from the cache, or generate and cache it
+def load_dataset(num_entries=1000, num_queries=100, regen=False):
+    # Datasets of different sizes are cached in different files
+    # Pass `regen=True` to generate a fresh dataset and overwrite the cached one
+    path = os.path.join(dataset_cache_dir, f'dataset_{num_entries}_{num_queries}.pkl')
+    if not regen and os.path.exists(path):
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+
+    data = generate_dataset(num_entries, num_queries)
+    os.makedirs(dataset_cache_dir, exist_ok=True)
+    with open(path, 'wb') as f:
+        pickle.dump(data, f, protocol=5)
+    return data
+
+# Stream a large dataset to a JSON Lines file
+def write_dataset(out_path, num_entries=1000, batch_size=10000):
+    # Only one batch of paragraphs is kept in memory at a time
+    # The file can be inserted with `MilvusClientInit.insert_from_jsonl`
+    words = make_words(word_pool_size)
+    total_chars = 0
+
+    with open(out_path, 'w', encoding='UTF-8') as out:
+        for start in range(0, num_entries, batch_size):
+            texts = [make_paragraph(words) for _ in range(min(batch_size, num_entries - start))]
+            out.writelines(json.dumps({'text': text}) + '\n' for text in texts)
+            total_chars += sum(map(len, texts))
+
+    stats = {
+        "path": out_path,
+        "entries": num_entries,
+        "total chars": total_chars,
+        "avg chars": total_chars / num_entries if num_entries else 0.0
+    }
+
+    return stats
+
+# Only generate the example dataset when executed as a script, so importing the module is free
+if __name__ == '__main__':
+    # Generate
+    data = generate_dataset(1000)
 
-# Print comprehensive dataset summary
-print("=== DATASET SUMMARY ===")
-print(f"Total dataset entries: {len(data['dataset']['data']):,}")
-print(f"Total dataset characters: {data['dataset']['total chars']:,}")
-print(f"Average dataset characters per entry: {data['dataset']['avg chars']:.1f}")
+    # Print comprehensive dataset summary
+    print("=== DATASET SUMMARY ===")
+    print(f"Total dataset entries: {len(data['dataset']['data']):,}")
+    print(f"Total dataset characters: {data['dataset']['total chars']:,}")
+    print(f"Average dataset characters per entry: {data['dataset']['avg chars']:.1f}")
 
-print(f"Total query entries: {len(data['queries']['data']):,}")
-print(f"Total query characters: {data['queries']['total chars']:,}")
-print(f"Average query characters per entry: {data['queries']['avg chars']:.1f}")
\ No newline at end of file
+    print(f"Total query entries: {len(data['queries']['data']):,}")
+    print(f"Total query characters: {data['queries']['total chars']:,}")
+    print(f"Average query characters per entry: {data['queries']['avg chars']:.1f}")
\ No newline at end of file
@@ -1,69 +1,167 @@
 ### latency_test
 ## Executes a simple test of the latency of an Milvus server in Docker
 
+import os
 import time
+import logging
+import argparse
+import statistics
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+from pymilvus.exceptions import MilvusException # type: ignore
 from pyfiles.milvus_utils import MilvusClientInit
 from pyfiles.logger import logger
-from scripts.generate_dataset import data
+from scripts.generate_dataset import load_dataset
 
-logger.info(f'⚙️ Starting latency test in `./scripts/latency_test.py`')
+# Retries when the Milvus server is too busy to accept more collections
+create_max_retries = 5
+create_backoff_s = 0.1
 
 def measure_create_collection_latency(client, name):
-    start = time.perf_counter()
-    response = client.create_collection(name=name)
-    elapsed_ms = (time.perf_counter() - start) * 1000
-    logger.info(f"Latency: {elapsed_ms:.1f} ms")
-    return elapsed_ms
-
-def measure_insert_latency(client, name, data=data['dataset']['data']):
-    start = time.perf_counter()
-    response = client.insert(name=name, data=data)
-    elapsed_ms = (time.perf_counter() - start) * 1000
-    logger.info(f"Latency: {elapsed_ms:.1f} ms")
-    return elapsed_ms
-
-def measure_full_text_search_latency(client, name, query=data['queries']['data']):
-    start = time.perf_counter()
-    response = client.full_text_search(name=name, query_list=query, limit=5)
-    elapsed_ms = (time.perf_counter() - start) * 1000
-    logger.info(f"Latency: {elapsed_ms:.1f} ms")
-    return elapsed_ms
-
-def run_test(client, n_tests, method_name):
-    latency_sum = 0
-    for i in range(n_tests):
-        name = f'_test_collection_{i}'
-        if method_name=='create_collection':
-            latency = measure_create_collection_latency(client, name=name)
-            latency_sum += latency
-            logger.info(f"Test {i}")
-        
-        if method_name=='insert':
-            latency = measure_insert_latency(client, name=name)
-            latency_sum += latency
-            logger.info(f"Test {i}")
-
-        if method_name=='full_text_search':
-            latency = measure_full_text_search_latency(client, name=name)
-            latency_sum += latency
-            logger.info(f"Test {i}")
-            client.drop_collection(name=name)
-
-    latency_avg = latency_sum/n_tests
-    logger.info(f"Latency average for {method_name}: {latency_avg:.1f}")
-
-
-n_tests = 10
-## Initialize Milvus client
-# Defaults to host on url 'http://localhost:19530'
-client: MilvusClientInit = MilvusClientInit()
-# Warmup client
-client.list_collections()
-# Test create collection latency
-run_test(client, n_tests, 'create_collection')
-# Test insert data latency
-run_test(client, n_tests, 'insert')
-# Test full text search latency
-run_test(client, n_tests, 'full_text_search')
-
-logger.info(f'✅ Finished latency test in `./scripts/latency_test.py` \n\n')
\ No newline at end of file
+    start = time.perf_counter_ns()
+    for attempt in range(create_max_retries + 1):
+        try:
+            response = client.create_collection(name=name)
+            break
+        except MilvusException as e:
+            # Back off exponentially when concurrent creates fill the server's task queue
+            if 'task queue is full' not in str(e) or attempt == create_max_retries:
+                raise
+            time.sleep(create_backoff_s * 2 ** attempt)
+    return time.perf_counter_ns() - start
+
+# Number of rows sent per insert request
+insert_batch_size = 10000
+
+def measure_insert_latency(client, name, data):
+    start = time.perf_counter_ns()
+    response = client.insert(name=name, data=data, batch_size=insert_batch_size)
+    return time.perf_counter_ns() - start
+
+def measure_full_text_search_latency(client, name, query):
+    # The search runs right after an unflushed insert, so 'Strong' makes sure the inserted data is searched
+    start = time.perf_counter_ns()
+    response = client.full_text_search(name=name, query_list=query, limit=5, consistency_level='Strong')
+    return time.perf_counter_ns() - start
+
+def make_measures(data):
+    # Methods to measure on each collection, in order
+    # Payloads are bound once so nothing is generated or converted while timing
+    # Rows are already in the format the Milvus client sends, so they're passed as is
+    return {
+        'create_collection': measure_create_collection_latency,
+        'insert': partial(measure_insert_latency, data=data['dataset']['data']),
+        'full_text_search': partial(measure_full_text_search_latency, query=data['queries']['data'])
+    }
+
+def run_lifecycle(client, name, measures):
+    # Create, fill, and search the same collection
+    # This makes sure inserts and searches always run on a real, populated collection
+    # The collection is dropped later with `drop_all`, so drops don't compete with the measured calls
+    return {method_name: measure(client, name=name) for method_name, measure in measures.items()}
+
+# Number of collections dropped at the same time
+drop_max_workers = 16
+
+def drop_all(client, names):
+    # Drop the collections concurrently over the client's connection
+    # This relies on the client's collections and results caches being safe to update from several threads
+    with ThreadPoolExecutor(max_workers=drop_max_workers) as executor:
+        list(executor.map(lambda name: client.drop_collection(name=name), names))
+
+def run_test(client, names, measures, concurrency=1):
+    start = time.perf_counter_ns()
+    if concurrency == 1:
+        results = [run_lifecycle(client, name, measures) for name in names]
+    else:
+        # Collections are tested at the same time over the client's connection, which multiplexes concurrent requests
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = list(executor.map(lambda name: run_lifecycle(client, name, measures), names))
+    wall_ns = time.perf_counter_ns() - start
+    # Drop the collections once all calls are timed
+    drop_all(client, names)
+
+    # Latencies are only logged once all calls are done, so logging doesn't slow down the test
+    for method_name in measures:
+        latencies = [result[method_name] for result in results]
+        if logger.isEnabledFor(logging.DEBUG):
+            for i, latency in enumerate(latencies):
+                logger.debug("Test %d %s latency: %.3f ms", i, method_name, latency / 1e6)
+        log_summary(method_name, latencies)
+    logger.info(f"Total time for {len(names)} collections with concurrency {concurrency}: {wall_ns / 1e6:.3f} ms")
+
+def log_summary(method_name, latencies):
+    # Latencies are integer nanoseconds, only converted to milliseconds for display
+    # Percentiles need at least two latencies
+    if len(latencies) > 1:
+        percentiles = statistics.quantiles(latencies, n=100, method='inclusive')
+        p50, p95, p99 = percentiles[49], percentiles[94], percentiles[98]
+    else:
+        p50 = p95 = p99 = latencies[0]
+    logger.info(
+        f"Latency for {method_name} (ms) | "
+        f"min {min(latencies) / 1e6:.3f} | avg {statistics.fmean(latencies) / 1e6:.3f} | "
+        f"p50 {p50 / 1e6:.3f} | p95 {p95 / 1e6:.3f} | p99 {p99 / 1e6:.3f}"
+    )
+
+# Prefixes of the collections created by this script
+# They differ from the integration tests' `_test_collection_`, so a sweep never drops the collections of a running test suite
+test_prefixes = ('_latency_collection_',)
+
+def sweep(client, prefixes=test_prefixes):
+    # Drop collections left behind by this script, e.g. by a run that failed midway
+    # Leftover collections would collide with the next run and bloat the server's metadata
+    drop_all(client, [name for name in client.list_collections() if name.startswith(prefixes)])
+
+def warmup(client, measures, name='_latency_collection_warmup'):
+    # Run every measured method once before timing,
+    # so the first test doesn't pay for cold code paths on the client and server
+    client.list_collections()
+    run_lifecycle(client, name, measures)
+    client.drop_collection(name=name)
+
+def positive_int(value):
+    # Parse a command line argument that must be at least 1, so bad values are rejected before connecting
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f'must be at least 1, instead got {number}')
+    return number
+
+
+# Only run the test when executed as a script, so the module can be imported without side effects
+if __name__ == '__main__':
+    logger.info(f'⚙️ Starting latency test in `./scripts/latency_test.py`')
+
+    ## Parse arguments
+    # Number of collections to test at the same time, e.g. `python -m scripts.latency_test --concurrency 10`
+    parser = argparse.ArgumentParser(description='Measure the latency of a Milvus server.')
+    parser.add_argument('--concurrency', type=positive_int, default=1, help='Number of collections to test at the same time.')
+    args = parser.parse_args()
+
+    ## Load the data
+    # The dataset is generated once then cached, set `REGEN_DATASET=1` to generate a fresh one
+    measures = make_measures(load_dataset(1000, regen=os.environ.get('REGEN_DATASET') == '1'))
+
+    n_tests = 10
+    # Each test creates, fills, searches, then drops its own collection
+    names = [f'_latency_collection_{i}' for i in range(n_tests)]
+    ## Initialize Milvus client
+    # Defaults to host on url 'http://localhost:19530'
+    # The same client (and connection) is used for all tests
+    # The results cache is disabled so every search is sent to the Milvus server
+    client: MilvusClientInit = MilvusClientInit(results_cache_size=0)
+    # Start from a clean server
+    sweep(client)
+    try:
+        # Warmup every method on a throwaway collection
+        # The summaries also report p50 and p95, which are less skewed by slow calls than the average
+        warmup(client, measures)
+        # Test the latency of every method
+        run_test(client, names, measures, concurrency=args.concurrency)
+    finally:
+        # Leave nothing behind, even if the test fails
+        sweep(client)
+        # Close the connection to the Milvus server
+        MilvusClientInit.shutdown()
+
+    logger.info(f'✅ Finished latency test in `./scripts/latency_test.py` \n\n')
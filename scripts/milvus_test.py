@@ -6,6 +6,7 @@
 #   - Insert example data
 #   - Do a full text search for example query
 #   - Drop collection to cleanup
+#   - Close the connection to the Milvus server
 
 ## Imports
 # Third-party modules
@@ -23,7 +24,7 @@ client = MilvusClientInit()
 
 ## Drop collection if it exists, then create collection
 collection_name: str = collection_name
-collections: List[str | None] = client.list_collections()
+collections: List[str] = client.list_collections()
 if collection_name in collections:
     logger.info(f'⚠️ `{collection_name}` already exists, dropping it')
     client.drop_collection(collection_name)
@@ -31,15 +32,26 @@ client.create_collection()
 
 ## Insert data
 # Defaults to inserting a list of dictionaries with text (see `data_ex` of `milvus_types.py) into the `collection_ex` collection
-client.insert()
+# Wait for the data to be flushed so the search below can find it
+client.insert(wait_for_flush=True)
 
 ## Get search results
 # Defaults to query the `collection_ex` collection
 # Searches for a default query list given by `query_list` in `milvus_utils.py`
 # Defaults to a maximum of 3 results
-client.full_text_search()
+# Use strong consistency so the data inserted above is searched
+results = client.full_text_search(consistency_level='Strong')
+# Show the text of each result
+# No results are returned if the collection doesn't exist
+if results is not None:
+    for i, result in enumerate(results):
+        for hit in result:
+            logger.info(f"📝 Query {i} | distance {hit['distance']:.3f} | {hit['entity']['text']}")
 
 ## Drop collection to clean up at end
 client.drop_collection(collection_name)
 
+## Close the connection to the Milvus server
+MilvusClientInit.shutdown()
+
 logger.info(f'✅ Finished Milvus test in `./milvus_test.py` \n\n')
\ No newline at end of file
@@ -0,0 +1,34 @@
+### tests/conftest.py
+## Defines pytest options shared by all tests
+
+## Imports
+# Third-party modules
+import pytest
+
+
+## Add the option to run slow tests
+def pytest_addoption(parser):
+    """
+    Add the `--run-slow` option to pytest.
+
+    Tests marked `slow` are skipped unless this option is given.
+    """
+    parser.addoption(
+        "--run-slow", 
+        action="store_true", 
+        default=False, 
+        help="run tests marked as slow"
+    )
+
+
+## Skip slow tests by default
+def pytest_collection_modifyitems(config, items):
+    """
+    Skip every test marked `slow` when pytest is run without `--run-slow`.
+    """
+    if config.getoption("--run-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="slow test, use --run-slow to run it")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
@@ -0,0 +1,96 @@
+### tests/test_bench_milvus.py
+## Defines benchmarks for the latency of methods in ./pyfiles/milvus_utils.py against a Milvus server
+## Run only the benchmarks with `pytest tests/test_bench_milvus.py`
+
+## Imports
+# Third-party modules
+import pytest
+from pymilvus.exceptions import MilvusException # type: ignore
+
+# Skip all benchmarks if pytest-benchmark isn't installed
+pytest.importorskip('pytest_benchmark')
+
+# Internal modules
+from pyfiles.milvus_utils import (
+    MilvusClientInit,
+    uri,
+    data_ex,
+    query_list,
+    lim_results
+)
+
+## Define collection names to use purely for benchmarks
+collection_name = '_bench_collection'
+create_collection_name = '_bench_create_collection'
+
+
+## Client shared by all benchmarks
+# A single connection is used for the whole session, so connecting isn't part of the timings
+@pytest.fixture(scope='session')
+def client():
+    """
+    Connect a client to the Milvus server once for all benchmarks.
+
+    The results cache is disabled so every search is sent to the Milvus server.
+
+    Raises
+    ------------
+        pytest.skip.Exception
+            When the Milvus server is not reachable at http://localhost:19530.
+    """
+    try:
+        client = MilvusClientInit(uri=uri, results_cache_size=0)
+        client.list_collections()
+    except MilvusException:
+        pytest.skip("Milvus server not accessible at http://localhost:19530.")
+    yield client
+    MilvusClientInit.shutdown()
+
+
+## Collection with data shared by the insert and search benchmarks
+@pytest.fixture(scope='module')
+def collection(client):
+    """
+    Create a collection with the example data, then drop it once all benchmarks are done.
+    """
+    client.create_collection(name=collection_name)
+    client.insert(name=collection_name, data=data_ex, wait_for_flush=True)
+    yield collection_name
+    client.drop_collection(name=collection_name)
+
+
+## Benchmark creating a collection
+@pytest.mark.benchmark(group='milvus_latency')
+def test_bench_create(benchmark, client):
+    """
+    Benchmark creating a collection.
+    The collection is dropped before each round, outside of the timings.
+    """
+    drop = lambda: client.drop_collection(name=create_collection_name)
+    benchmark.pedantic(
+        client.create_collection,
+        kwargs={'name': create_collection_name},
+        setup=drop,
+        rounds=10
+    )
+    drop()
+
+
+## Benchmark inserting data
+@pytest.mark.benchmark(group='milvus_latency')
+def test_bench_insert(benchmark, client, collection):
+    """
+    Benchmark inserting the example data into a collection.
+    """
+    results = benchmark(client.insert, name=collection, data=data_ex)
+    assert results['insert_count'] == len(data_ex)
+
+
+## Benchmark performing a full text search
+@pytest.mark.benchmark(group='milvus_latency')
+def test_bench_search(benchmark, client, collection):
+    """
+    Benchmark performing a full text search on a collection.
+    """
+    results = benchmark(client.full_text_search, name=collection, query_list=query_list, limit=lim_results)
+    assert len(results) == len(query_list)
@@ -1,13 +1,12 @@
 ### tests/test_integration.py
 ## Defines integration tests for making sure methods in ./pyfiles/milvus_utils.py can be properly used with Milvus server
 
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 ## Imports
 # Third-party modules
+import os
+import uuid
 import pytest
+import asyncio
 import unittest
 from pymilvus import MilvusClient # type: ignore
 from pymilvus.exceptions import MilvusException # type: ignore
@@ -24,6 +23,25 @@ from pyfiles.milvus_utils import (
 
 ## Define collection name to use purely for tests
 collection_name = '_test_collection'
+# Number of collections used at the same time by the concurrent test
+n_concurrent = 4
+
+
+## Make a collection name that no other test uses
+# Each test works on its own collection, so tests can run in any order and in parallel with `pytest -n auto`
+def unique_collection_name() -> str:
+    """
+    Make a collection name unique to the current test run.
+
+    The name includes the pytest-xdist worker id (or 'main' when not running in parallel) and a random suffix.
+
+    Returns
+    ------------
+        str: 
+            A collection name starting with '_test_collection_'.
+    """
+    worker_id = os.environ.get('PYTEST_XDIST_WORKER', 'main')
+    return f'{collection_name}_{worker_id}_{uuid.uuid4().hex[:8]}'
 
 
 class TestMilvusClientIntegration(unittest.TestCase):
@@ -50,14 +68,32 @@ class TestMilvusClientIntegration(unittest.TestCase):
         Set up class-level fixtures once for all tests.
 
         This setup ensures that common values are defined before any individual test runs.
+        A single client is shared by all tests, so the connection to the Milvus server is only made once.
 
         Variables
         ------------
             uri: str
                 URI of the Milvus server.
                 Defaults to 'http://localhost:19530'.
+            client: MilvusClientInit | None
+                Client shared by all tests, or None if the Milvus server isn't accessible.
+            probe_client: MilvusClient | None
+                Client used to check that the Milvus server is accessible, or None if it isn't.
+            _milvus_available: bool
+                Whether the Milvus server was accessible.
         """
         cls.test_uri = uri
+        cls.probe_client = None
+        cls.client = None
+        cls._milvus_available = False
+        # Verify Milvus server is accessible once for all tests
+        try:
+            cls.probe_client = MilvusClient(uri=uri)
+            cls._milvus_available = isinstance(cls.probe_client.list_collections(), list)
+            cls.client = MilvusClientInit(uri=uri)
+        # If we get connection error, every test will be skipped in `setUp`
+        except MilvusException:
+            cls._milvus_available = False
 
 
     ## Set up for each test
@@ -69,7 +105,7 @@ class TestMilvusClientIntegration(unittest.TestCase):
 
         Verifications
         ------------
-            Milvus server is accessible by attempting a `list_collections` request.
+            Milvus server was accessible when attempting a `list_collections` request in `setUpClass`.
             If the server is unreachable, this test will be skipped with a message.
 
         Raises
@@ -77,21 +113,14 @@ class TestMilvusClientIntegration(unittest.TestCase):
             unittest.SkipTest
                 When the Milvus server is not reachable at http://localhost:19530.
         """
-        error_message = "Milvus server not accessible at http://localhost:19530."
-        # Verify Milvus server is accessible before running tests
-        try:
-            client = MilvusClient(uri=uri)
-            collections = client.list_collections()
-            # If collections isn't a list, print error message
-            self.assertTrue(isinstance(collections, list), error_message)
-        # If we get connection error, skip the test
-        except MilvusException:
-            self.skipTest(error_message)
+        # The server was already probed once for the class, so no request is needed here
+        if not self._milvus_available:
+            self.skipTest("Milvus server not accessible at http://localhost:19530.")
+        # Collection used only by this test
+        self.collection_name = unique_collection_name()
 
 
     ## Test initializing client
-    # Can run this test 1st because client will need to be initialized for every other test
-    @pytest.mark.order(1)
     def test_client_initialization(self):
         """
         Test that MilvusClientInit can be initialized successfully.
@@ -118,7 +147,6 @@ class TestMilvusClientIntegration(unittest.TestCase):
             self.fail(f"Failed to initialize MilvusClientInit: {e}")
 
 
-    @pytest.mark.order(2)
     ## Test listing collections
     def test_list_collections(self):
         """
@@ -135,8 +163,8 @@ class TestMilvusClientIntegration(unittest.TestCase):
             Exception: 
                 If any verifications fail.
         """
-        # We already know whether client can be properly initialized with first test, so we can leave it out of try - except blocks
-        client = MilvusClientInit(uri=self.test_uri)
+        # We already know whether client can be properly initialized with `test_client_initialization`, so we can leave it out of try - except blocks
+        client = self.client
         try:
             collections = client.list_collections()
             # Should be a list of models names
@@ -145,8 +173,51 @@ class TestMilvusClientIntegration(unittest.TestCase):
             self.fail(f"Failed to list collections: {e}")
 
 
-    @pytest.mark.order(3)
+    ## Test the full lifecycle of a collection
+    # Covers the same methods as the granular tests below in a single test, which are only needed to narrow down regressions
+    def test_collection_lifecycle(self):
+        """
+        Test creating, inserting into, searching, and dropping a collection.
+
+        Ensures that every collection method works on the same collection in sequence.
+
+        Verifications
+        ------------
+            Added collection exists.
+            Insert return type is a dictionary.
+            Search return type is a `SearchResult`.
+            Removed collection doesn't exist.
+        
+        Raises
+        ------------
+            Exception: 
+                If any verifications fail.
+        """
+        client = self.client
+        name = self.collection_name
+        try:
+            client.create_collection(name=name)
+            self.assertTrue(client.has_collection(name=name))
+
+            self.assertIsInstance(client.insert(name=name, data=data_ex), dict)
+
+            # Strong consistency makes sure the data inserted above is searched
+            results = client.full_text_search(
+                name=name, 
+                query_list=query_list,
+                limit=lim_results,
+                consistency_level='Strong'
+            )
+            self.assertIsInstance(results, SearchResult)
+
+            client.drop_collection(name=name)
+            self.assertFalse(client.has_collection(name=name))
+        except Exception as e:
+            self.fail(f"Failed to run the collection lifecycle: {e}")
+
+
     ## Test creating collection
+    @pytest.mark.slow
     def test_create_collection(self):
         """
         Test creating collection for Milvus client.
@@ -155,25 +226,24 @@ class TestMilvusClientIntegration(unittest.TestCase):
 
         Verifications
         ------------
-            Added collection is in collection list.
+            Added collection exists.
         
         Raises
         ------------
             Exception: 
                 If any verifications fail.
         """
-        client = MilvusClientInit(uri=self.test_uri)
+        client = self.client
         try:
-            client.create_collection(name=collection_name)
-            collections = client.list_collections()
-            # collection_name should be in collections
-            self.assertIn(collection_name, collections)
+            client.create_collection(name=self.collection_name)
+            # collection_name should exist
+            self.assertTrue(client.has_collection(name=self.collection_name))
         except Exception as e:
             self.fail(f"Failed to create collection: {e}")
 
 
-    @pytest.mark.order(4)
     ## Test inserting data
+    @pytest.mark.slow
     def test_insert(self):
         """
         Test inserting data into collection.
@@ -189,17 +259,18 @@ class TestMilvusClientIntegration(unittest.TestCase):
             Exception: 
                 If any verifications fail.
         """
-        client = MilvusClientInit(uri=self.test_uri)
+        client = self.client
+        client.create_collection(name=self.collection_name)
         try:
-            results = client.insert(name=collection_name, data=data_ex)
+            results = client.insert(name=self.collection_name, data=data_ex)
             # Results should be a dictionary
             self.assertIsInstance(results, dict)
         except Exception as e:
             self.fail(f"Failed to insert data: {e}")    
 
 
-    @pytest.mark.order(5)
     ## Test performing full text search
+    @pytest.mark.slow
     def test_full_text_search(self):
         """
         Test performing full text search on inserted data.
@@ -215,12 +286,16 @@ class TestMilvusClientIntegration(unittest.TestCase):
             Exception: 
                 If any verifications fail.
         """
-        client = MilvusClientInit(uri=self.test_uri)
+        client = self.client
+        client.create_collection(name=self.collection_name)
+        client.insert(name=self.collection_name, data=data_ex)
         try:
+            # Strong consistency makes sure the data inserted above is searched
             results = client.full_text_search(
-                name=collection_name, 
+                name=self.collection_name, 
                 query_list=query_list,
-                limit=lim_results
+                limit=lim_results,
+                consistency_level='Strong'
             )
             # Results should be a `SearchResult`
             self.assertIsInstance(results, SearchResult)
@@ -228,8 +303,8 @@ class TestMilvusClientIntegration(unittest.TestCase):
             self.fail(f"Failed to perform a full text search: {e}")  
 
 
-    @pytest.mark.order(6)
     ## Test dropping collection
+    @pytest.mark.slow
     def test_drop_collection(self):
         """
         Test dropping collection for Milvus client.
@@ -238,19 +313,19 @@ class TestMilvusClientIntegration(unittest.TestCase):
 
         Verifications
         ------------
-            Removed collection is not in collection list.
+            Removed collection doesn't exist.
         
         Raises
         ------------
             Exception: 
                 If any verifications fail.
         """
-        client = MilvusClientInit(uri=self.test_uri)
+        client = self.client
+        client.create_collection(name=self.collection_name)
         try:
-            client.drop_collection(name=collection_name)
-            collections = client.list_collections()
-            # collection_name shouldn't be in collections
-            self.assertNotIn(collection_name, collections)
+            client.drop_collection(name=self.collection_name)
+            # collection_name shouldn't exist
+            self.assertFalse(client.has_collection(name=self.collection_name))
         except Exception as e:
             self.fail(f"Failed to drop collection: {e}")
 
@@ -260,10 +335,124 @@ class TestMilvusClientIntegration(unittest.TestCase):
         """
         Clean up after each test method.
 
-        Currently performs no actions but serves as a placeholder for future cleanup logic.
+        Drops the collection used by the test, whether the test passed or not.
+        Nothing is dropped if the test didn't create the collection.
+        """
+        self.client.drop_collection(name=self.collection_name)
+
+
+    ## Tear down after finishing all tests
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Clean up class-level fixtures.
+
+        Closes the Milvus clients shared by all the tests.
+        """
+        if cls.probe_client is not None:
+            cls.probe_client.close()
+        MilvusClientInit.shutdown()
+
+
+class TestMilvusClientConcurrentIntegration(unittest.IsolatedAsyncioTestCase):
+    """
+    Concurrent integration tests for MilvusClientInit against a real Milvus server.
+
+    These tests ensure that the methods in `pyfiles.milvus_utils` give correct results when many requests share the client's connection at the same time.
+    The client's methods are synchronous, so each call is run in its own thread with `asyncio.to_thread`.
+
+    All tests require a running Milvus server at http://localhost:19530.
+    """
+
+    ## Class resources
+    # This sets up resources that are used for each test in the class
+    @classmethod
+    def setUpClass(cls):
+        """
+        Set up class-level fixtures once for all tests.
+
+        Variables
+        ------------
+            client: MilvusClientInit | None
+                Client shared by all tests, or None if the Milvus server isn't accessible.
+        """
+        try:
+            cls.client = MilvusClientInit(uri=uri)
+            cls.client.list_collections()
+        # If we get connection error, every test will be skipped in `setUp`
+        except MilvusException:
+            cls.client = None
+
+
+    ## Set up for each test
+    def setUp(self):
+        """
+        Set up test fixtures before each test method.
+
+        Raises
+        ------------
+            unittest.SkipTest
+                When the Milvus server is not reachable at http://localhost:19530.
+        """
+        if self.client is None:
+            self.skipTest("Milvus server not accessible at http://localhost:19530.")
+
+
+    ## Test running every operation concurrently
+    async def test_all_ops_concurrent(self):
+        """
+        Test creating, inserting into, searching, and dropping many collections at the same time.
+
+        Ensures that concurrent requests over one connection give the same results as sequential ones.
+
+        Verifications
+        ------------
+            Every created collection is in collection list.
+            Every insert returns a dictionary with an insert count matching the data.
+            Every search returns a `SearchResult` with one list of hits per query.
+            Every dropped collection is not in collection list.
+
+        Raises
+        ------------
+            Exception: 
+                If any verifications fail.
         """
-        # Nothing special to clean up for this test
-        pass
+        client = self.client
+        names = [unique_collection_name() for _ in range(n_concurrent)]
+        try:
+            await asyncio.gather(*(asyncio.to_thread(client.create_collection, name=name) for name in names))
+            collections = client.list_collections()
+            for name in names:
+                self.assertIn(name, collections)
+
+            inserts = await asyncio.gather(*(
+                asyncio.to_thread(client.insert, name=name, data=data_ex) for name in names
+            ))
+            for results in inserts:
+                self.assertIsInstance(results, dict)
+                self.assertEqual(results['insert_count'], len(data_ex))
+
+            # Strong consistency makes sure the data inserted above is searched
+            searches = await asyncio.gather(*(
+                asyncio.to_thread(
+                    client.full_text_search, 
+                    name=name, 
+                    query_list=query_list, 
+                    limit=lim_results, 
+                    consistency_level='Strong'
+                ) for name in names
+            ))
+            for results in searches:
+                self.assertIsInstance(results, SearchResult)
+                self.assertEqual(len(results), len(query_list))
+        except Exception as e:
+            self.fail(f"Failed to run operations concurrently: {e}")
+        finally:
+            await asyncio.gather(*(asyncio.to_thread(client.drop_collection, name=name) for name in names))
+
+        collections = client.list_collections()
+        for name in names:
+            self.assertNotIn(name, collections)
 
 
     ## Tear down after finishing all tests
@@ -272,7 +461,6 @@ class TestMilvusClientIntegration(unittest.TestCase):
         """
         Clean up class-level fixtures.
 
-        Currently performs no actions but serves as a placeholder for future cleanup logic.
+        Closes the Milvus client shared by all the tests.
         """
-        # Nothing special to clean up for this test
-        pass
\ No newline at end of file
+        MilvusClientInit.shutdown()
@@ -1,10 +1,6 @@
 ### tests/test_unit_logger.py
 ## Defines unit tests for methods in ./pyfiles/logger.py
 
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 ## Imports
 # Third-party modules
 from unittest import TestCase
@@ -18,7 +14,7 @@ from logging import Formatter, LogRecord
 from rich.progress import Progress
 
 # Internal modules
-from pyfiles.logger import ElapsedFormatter, with_spinner
+from pyfiles.logger import ElapsedFormatter, with_spinner, _spinner_lock
 
 
 ## Now let's test everything
@@ -102,4 +98,89 @@ class TestLoggerUnit(TestCase):
             with patch("pyfiles.logger.Progress", mock_progress_cls):
                 with self.assertRaises(Exception):
                     with with_spinner(description):
-                        pass
\ No newline at end of file
+                        pass
+
+
+    ## Test spinner already shown
+    def test_with_spinner_lock_held(self):
+        """
+        Test invoking the spinner while another spinner is shown.
+        
+        Verifications
+        ------------
+            The task runs without a spinner when the spinner lock is already held.
+            Completion of the task is still logged.
+
+        Mocks
+        ------------
+            `pyfiles.logger.logger` is mocked and returns a mock instance.
+            `Progress` is mocked and returns a mock instance.
+        
+        Asserts
+        ------------
+            The body of the task runs.
+            `Progress` is never created.
+            The completion of the task is logged.
+        """
+        ## Arrange
+        description = "Test task"
+        # logger | Create a mock instance of the logger
+        mock_logger = MagicMock()
+        # Progress | Create a mock instance of the Progress class
+        mock_progress_cls = MagicMock()
+        ran = False
+
+        ## Act
+        with patch("pyfiles.logger.logger", mock_logger), patch("pyfiles.logger.Progress", mock_progress_cls):
+            with _spinner_lock:
+                with with_spinner(description):
+                    ran = True
+
+        ## Assert
+        self.assertTrue(ran)
+        mock_progress_cls.assert_not_called()
+        mock_logger.info.assert_has_calls([
+            call(f"⚙️ Starting task: {description}"),
+            call(f"✅ Completed task: {description}")
+        ])
+
+
+    ## Test spinner lock release after failure
+    def test_with_spinner_lock_released(self):
+        """
+        Test that the spinner lock is released when the task fails.
+        
+        Verifications
+        ------------
+            The spinner lock isn't held after the body of the task raises.
+            A later task is shown with a spinner again.
+
+        Mocks
+        ------------
+            `pyfiles.logger.logger` is mocked and returns a mock instance.
+            `Progress` is mocked and returns a mock instance.
+        
+        Asserts
+        ------------
+            Exception is raised by the failed task.
+            The spinner lock isn't held after the failed task.
+            `Progress` is created for both tasks.
+        """
+        ## Arrange
+        description = "Test task"
+        # logger | Create a mock instance of the logger
+        mock_logger = MagicMock()
+        # Progress | Create a mock instance of the Progress class
+        mock_progress_cls = MagicMock()
+
+        with patch("pyfiles.logger.logger", mock_logger), patch("pyfiles.logger.Progress", mock_progress_cls):
+            ## Act and assert
+            with self.assertRaises(Exception):
+                with with_spinner(description):
+                    raise Exception("task error")
+            self.assertFalse(_spinner_lock.locked())
+
+            with with_spinner(description):
+                pass
+
+        self.assertEqual(mock_progress_cls.call_count, 2)
@@ -1,16 +1,18 @@
 ### tests/test_unit_milvus.py
 ## Defines unit tests for methods in ./pyfiles/milvus_utils.py to be used without a Milvus server
 
-import sys
-import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 ## Imports
 # Third-party modules
+import os
+import json
+import tempfile
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor, wait
 from unittest import TestCase
 from unittest.mock import (
     call, 
     patch, 
+    DEFAULT,
     MagicMock
 )
 from pymilvus import (
@@ -18,11 +20,11 @@ from pymilvus import (
     CollectionSchema
 )
 from pymilvus.exceptions import MilvusException
+from pymilvus.grpc_gen.schema_pb2 import SearchResultData
 from pymilvus.milvus_client.index import IndexParams
 from pymilvus.client.search_result import (
     SearchResult, 
-    HybridHits, 
-    Hit
+    HybridHits
 )
 
 # Internal modules
@@ -34,12 +36,97 @@ from pyfiles.milvus_utils import (
     func_bm25, 
     data_ex, 
     query_list, 
-    lim_results
+    lim_results,
+    collections_cache_ttl,
+    results_cache_ttl,
+    results_cache_write_window
 )
 
 ## Define collection name to use purely for tests
 collection_name = '_test_collection'
 
+## Define the arguments expected for every full text search
+# They're built once for all tests, and are read-only so no test can change them for the others
+expected_anns_field = 'sparse'
+expected_output_fields = ('text',)
+expected_search_params = MappingProxyType({
+    'params': MappingProxyType({'drop_ratio_search': 0.2}),
+})
+
+## Define errors raised by the validators for bad arguments
+# Pydantic wraps the validators' ValueErrors in a ValidationError, which is also a ValueError
+validation_errors = (TypeError, ValueError)
+
+## Define values of the wrong type shared by the tests for bad arguments
+# They're built once for all tests, and are tuples so no test can change them for the others
+# None of these are valid for a string, a list of strings, a client, a schema, or index parameters
+invalid_types = (
+    ([1], "list"),
+    ([1, 'Hi'], "list with mixed types"),
+    ({1, 'Hi'}, "set"),
+    (1, "integer"),
+    (3.14, "float"),
+    (None, "NoneType"),
+    (True, "boolean")
+)
+# Same as above, for arguments where a dictionary is also invalid
+invalid_types_and_dict = invalid_types + (({'key': 1, 'value': 'Hi'}, "dictionary"),)
+# Same as above without the integer, for arguments where an integer can be valid
+invalid_types_but_int = tuple(value for value in invalid_types if value[1] != "integer")
+# None of these are valid for a positive integer
+invalid_positive_ints = (
+    ([1, 2], "list of integers"),
+    (3.14, "float"),
+    (None, "NoneType"),
+    (True, "boolean"),
+    (0, "zero"),
+    (-1, "negative integer")
+)
+# None of these are valid for a boolean
+invalid_bools = (
+    ([1, 2], "list of integers"),
+    (1, "integer"),
+    (None, "NoneType"),
+    ('True', "string")
+)
+# None of these are valid data to insert
+invalid_insert_data = invalid_types + (
+    ({'text': 'Hi'}, "column that isn't a list"),
+    ({'text': ['Hi'], 'id': [1, 2]}, "columns of different lengths")
+)
+# None of these are valid consistency levels for a search
+invalid_search_consistency_levels = invalid_types_but_int + (("Eventual", "unknown consistency level"),)
+# None of these are valid settings for `MilvusClientInit`
+invalid_init_settings = (
+    ({'inverted_index_algo': 'WAND'}, "unknown algorithm"),
+    ({'inverted_index_algo': 1}, "integer algorithm"),
+    ({'drop_ratio_search': '0.2'}, "string drop ratio"),
+    ({'drop_ratio_search': True}, "boolean drop ratio"),
+    ({'drop_ratio_search': 1.0}, "drop ratio of 1"),
+    ({'drop_ratio_search': -0.1}, "negative drop ratio"),
+    ({'results_cache_size': 1.5}, "float cache size"),
+    ({'results_cache_size': True}, "boolean cache size"),
+    ({'results_cache_size': -1}, "negative cache size"),
+    ({'compression': 'gzip'}, "string compression")
+)
+
+
+## Make mocked clients
+# All mocked clients are built here, so they share the same spec
+def make_mock_client() -> MagicMock:
+    """
+    Make a mock instance of `MilvusClient`.
+
+    The mock is built with `MilvusClient` as its spec, so it passes the `isinstance` checks of the validators.
+
+    Returns
+    ------------
+        MagicMock: 
+            A mock instance of `MilvusClient`.
+    """
+    return MagicMock(spec=MilvusClient)
+
+
 ## Now let's test everything
 class TestMilvusClientUnit(TestCase):
     """
@@ -83,22 +170,96 @@ class TestMilvusClientUnit(TestCase):
         
         Asserts
         ------------
-            Exception is raised when the method is passed bad argument types.
+            TypeError or ValueError is raised when the method is passed bad argument types.
         """
+        # The method and its arguments are set up once for all parameters
+        # The arguments are copied so the caller's dictionary isn't changed
+        method = getattr(client, method_name)
+        args = dict(method_args)
         for param, description in param_list:
+            args[param_name] = param
             with self.subTest(param_type=description):
-                with self.assertRaises(Exception):
-                    method = getattr(client, method_name)
-                    method_args[param_name] = param 
-                    method(**method_args)
+                with self.assertRaises(validation_errors):
+                    method(**args)
+
+
+    ## Class resources
+    @classmethod
+    def setUpClass(cls):
+        """
+        Set up class-level fixtures once for all tests.
+
+        The mocked `MilvusClient` is only built once, since building a mock with a spec inspects the whole class.
+
+        Variables
+        ------------
+            mock_client: MagicMock
+                Mock instance of `MilvusClient` shared by all tests.
+            mock_client_class: MagicMock
+                Mock of the `MilvusClient` class used by `MilvusClientInit` to connect new clients.
+            mock_schema: MagicMock
+                Mock instance of `CollectionSchema` shared by all tests.
+            mock_index_params: MagicMock
+                Mock instance of `IndexParams` shared by all tests.
+            expected_field_calls: List[call]
+                Calls expected to `MilvusClientInit._create_field` when creating a collection with the default fields.
+            expected_index_calls: List[call]
+                Calls expected to `MilvusClientInit._create_index` when creating a collection with the default indices.
+        """
+        cls.mock_client = make_mock_client()
+        # Schema and index params returned by the mocked client when creating a collection
+        # The calls expected for them only depend on the default parameters, so they're also built once
+        cls.mock_schema = MagicMock(spec=CollectionSchema)
+        cls.mock_index_params = MagicMock(spec=IndexParams)
+        cls.expected_field_calls = [call(cls.mock_schema, field_params) for field_params in field_params_list]
+        cls.expected_index_calls = [call(cls.mock_index_params, index_params) for index_params in index_params_list]
+        # The `MilvusClient` class is patched once for all tests, so no test can connect to a real server
+        cls.client_patcher = patch('pyfiles.milvus_utils.MilvusClient')
+        cls.mock_client_class = cls.client_patcher.start()
+
+
+    ## Set up for each test
+    def setUp(self):
+        """
+        Set up test fixtures before each test method.
+
+        Resets the shared mocks of `MilvusClient` so no calls, return values, or side effects leak between tests.
+
+        Variables
+        ------------
+            client: MilvusClientInit
+                Client using the shared mocked `MilvusClient`.
+        """
+        self.mock_client.reset_mock(return_value=True, side_effect=True)
+        self.mock_client_class.reset_mock(return_value=True, side_effect=True)
+        self.mock_schema.reset_mock(return_value=True, side_effect=True)
+        self.mock_index_params.reset_mock(return_value=True, side_effect=True)
+        self.client = MilvusClientInit(uri=uri, client=self.mock_client)
+
+
+    ## Tear down after finishing each test
+    def tearDown(self):
+        """
+        Clean up after each test method.
+
+        Closes and forgets the cached clients so every test starts without a connected client.
+        """
+        MilvusClientInit.shutdown()
+
+
+    ## Tear down after finishing all tests
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Clean up class-level fixtures.
+
+        Restores the `MilvusClient` class.
+        """
+        cls.client_patcher.stop()
 
 
     ## Test successful client initialization
-    @patch('pyfiles.milvus_utils.MilvusClient')
-    def test_init_success(
-        self, 
-        mock_client
-    ):
+    def test_init_success(self):
         """
         Test successful initialization of MilvusClient with a custom URI.
         
@@ -117,25 +278,92 @@ class TestMilvusClientUnit(TestCase):
             `MilvusClient` is called exactly once with correct host parameter.
         """
         ## Arrange
-        # MilvusClient | Create a mock instance of the client
-        mock_client_instance = MagicMock(spec=MilvusClient)
-        mock_client.return_value = mock_client_instance
+        # MilvusClient | Return the shared mock instance of the client
+        self.mock_client_class.return_value = self.mock_client
 
         ## Act
-        # MilvusClient call replaced with mock_client
+        # MilvusClient call replaced with self.mock_client_class
         client = MilvusClientInit(uri=uri)
 
         ## Assert
         self.assertEqual(client.uri, uri)
-        mock_client.assert_called_once_with(uri=uri)
+        self.mock_client_class.assert_called_once_with(uri=uri, grpc_options={})
+
+
+    ## Test reusing the client for the same URI
+    def test_init_reuses_client(self):
+        """
+        Test that clients initialized for the same URI share a single `MilvusClient`.
+        
+        Verifications
+        ------------
+            The `MilvusClient` is only created once for the same URI.
+            Shutting down closes the shared client so the next initialization creates a new one.
+        
+        Mocks
+        ------------
+            `MilvusClient` is mocked and returns a mock instance.
+        
+        Asserts
+        ------------
+            Both `MilvusClientInit` instances have the same `MilvusClient`.
+            `MilvusClient` is called once before and once after shutting down.
+            The shared client is closed when shutting down.
+        """
+        ## Arrange
+        # MilvusClient | Return the shared mock instance of the client
+        self.mock_client_class.return_value = self.mock_client
+
+        ## Act
+        client_0 = MilvusClientInit(uri=uri)
+        client_1 = MilvusClientInit(uri=uri)
+
+        ## Assert
+        self.assertIs(client_0.client, client_1.client)
+        self.mock_client_class.assert_called_once_with(uri=uri, grpc_options={})
+
+        MilvusClientInit.shutdown()
+        self.mock_client.close.assert_called_once()
+        MilvusClientInit(uri=uri)
+        self.assertEqual(self.mock_client_class.call_count, 2)
+
+
+    ## Test initializing a compressed client
+    def test_init_compression(self):
+        """
+        Test initializing a client with a gzip compressed connection.
+        
+        Verifications
+        ------------
+            The gzip option is added to the gRPC options of the `MilvusClient`.
+            Compressed and uncompressed clients don't share a connection.
+        
+        Mocks
+        ------------
+            `MilvusClient` is mocked and returns a mock instance.
+        
+        Asserts
+        ------------
+            `MilvusClient` is called once with the gzip option and once without it.
+        """
+        ## Arrange
+        # MilvusClient | Return the shared mock instance of the client
+        self.mock_client_class.return_value = self.mock_client
+
+        ## Act
+        MilvusClientInit(uri=uri, compression=True)
+        MilvusClientInit(uri=uri)
+
+        ## Assert
+        self.mock_client_class.assert_has_calls([
+            call(uri=uri, grpc_options={'grpc.default_compression_algorithm': 2}),
+            call(uri=uri, grpc_options={})
+        ])
+        self.assertEqual(self.mock_client_class.call_count, 2)
 
 
     ## Test unsuccessful client initialization
-    @patch('pyfiles.milvus_utils.MilvusClient')
-    def test_init_unavailable(
-        self, 
-        mock_client
-    ):
+    def test_init_unavailable(self):
         """
         Test error handling of `MilvusClientInit` when Milvus server unavailable.
         
@@ -155,7 +383,7 @@ class TestMilvusClientUnit(TestCase):
         ## Arrange
         # MilvusClient | Create error
         error = MilvusException
-        mock_client.side_effect = error
+        self.mock_client_class.side_effect = error
 
         ## Act and Assert
         with self.assertRaises(error):
@@ -177,31 +405,47 @@ class TestMilvusClientUnit(TestCase):
             Exception is raised when `MilvusClientInit` is passed a wrong URI type.
         """
         ## Arrange
-        invalid_uris = [
-            ([1], "list"),
-            ([1, 'Hi'], "list with mixed types"),
-            ({'key': 1, 'value': 'Hi'}, "dictionary"),
-            ({1, 'Hi'}, "set"),
-            (1, "integer"),
-            (3.14, "float"),
-            (None, "NoneType"),
-            (True, "boolean")
-        ]
+        invalid_uris = invalid_types_and_dict
 
         ## Act and Assert
         # Run through each uri
         for uri, description in invalid_uris:
             with self.subTest(uri_type=description):
-                with self.assertRaises(Exception):
+                with self.assertRaises(validation_errors):
                     MilvusClientInit(uri=uri)
 
 
+    ## Test error handling bad search settings
+    def test_init_bad_search_settings(self):
+        """
+        Test error handling of `MilvusClientInit` when passed bad BM25 search settings.
+        
+        Verifications
+        ------------
+            Initializing the `MilvusClientInit` raises an exception when passed an unknown search algorithm, a bad drop ratio, or a bad cache size.
+            Exception is propagated correctly.
+
+        Mocks
+        ------------
+            `MilvusClient` is mocked and returns a mock instance.
+        
+        Asserts
+        ------------
+            Exception is raised when `MilvusClientInit` is passed bad search settings.
+        """
+        ## Arrange
+        invalid_settings = invalid_init_settings
+
+        ## Act and Assert
+        # Run through each setting
+        for settings, description in invalid_settings:
+            with self.subTest(settings=description):
+                with self.assertRaises(validation_errors):
+                    MilvusClientInit(uri=uri, client=self.mock_client, **settings)
+
+
     ## Test error handling bad client
-    @patch('pyfiles.milvus_utils.MilvusClient')
-    def test_init_bad_client(
-        self, 
-        mock_client
-    ):
+    def test_init_bad_client(self):
         """
         Test error handling of `MilvusClientInit` when passed a wrong client type.
         
@@ -219,16 +463,7 @@ class TestMilvusClientUnit(TestCase):
             Exception is raised when `MilvusClientInit` is passed a wrong client type.
         """
         ## Arrange
-        invalid_clients = [
-            ([1], "list"),
-            ([1, 'Hi'], "list with mixed types"),
-            ({'key': 1, 'value': 'Hi'}, "dictionary"),
-            ({1, 'Hi'}, "set"),
-            (1, "integer"),
-            (3.14, "float"),
-            (None, "NoneType"),
-            (True, "boolean")
-        ]
+        invalid_clients = invalid_types_and_dict
 
         ## Act and Assert
         # Run through each client
@@ -236,9 +471,9 @@ class TestMilvusClientUnit(TestCase):
             with self.subTest(client_type=description):
                 # MilvusClient | Create a mock instance of the client
                 mock_client_instance = MagicMock(spec=client)
-                mock_client.return_value = mock_client_instance
-                with self.assertRaises(Exception):
-                    MilvusClientInit(uri=uri, client=mock_client)
+                self.mock_client_class.return_value = mock_client_instance
+                with self.assertRaises(TypeError):
+                    MilvusClientInit(uri=uri, client=self.mock_client_class)
 
 
     ## Test successful creation of field
@@ -263,11 +498,9 @@ class TestMilvusClientUnit(TestCase):
         params = field_params_list[0]
         # schema | Create a mock instance of the collection schema
         schema = MagicMock(spec=CollectionSchema)
-        # MilvusClient | Create a mock instance of the client
-        mock_client = MagicMock(spec=MilvusClient)
         
         ## Act
-        client = MilvusClientInit(uri=uri, client=mock_client)
+        client = self.client
         client._create_field(schema=schema, params=params)
 
         ## Assert
@@ -294,24 +527,14 @@ class TestMilvusClientUnit(TestCase):
             Exception is raised when the `_create_field` method is passed wrong argument types.
         """
         ## Arrange
-        invalid_schema = [
-            ([1], "list"),
-            ([1, 'Hi'], "list with mixed types"),
-            ({1, 'Hi'}, "set"),
-            (1, "integer"),
-            (3.14, "float"),
-            (None, "NoneType"),
-            (True, "boolean")
-        ]
+        invalid_schema = invalid_types
         invalid_params = invalid_schema
         valid_params = field_params_list[0]
         # schema | Create a mock instance of a valid collection schema
         valid_schema = MagicMock(spec=CollectionSchema)
-        # MilvusClient | Create a mock instance of the client
-        mock_client = MagicMock(spec=MilvusClient)        
 
         ## Act
-        client = MilvusClientInit(uri=uri, client=mock_client)
+        client = self.client
 
         ## Act and Assert
         # Run through each invalid schema with valid params
@@ -358,11 +581,9 @@ class TestMilvusClientUnit(TestCase):
         # schema | Create a mock instance of the collection schema
         schema = MagicMock(spec=CollectionSchema)
         schema.add_field.side_effect = Exception
-        # MilvusClient | Create a mock instance of the client
-        mock_client = MagicMock(spec=MilvusClient)
         
         ## Act
-        client = MilvusClientInit(uri=uri, client=mock_client)
+        client = self.client
 
         ## Assert
         with self.assertRaises(Exception):
@@ -386,20 +607,25 @@ class TestMilvusClientUnit(TestCase):
         Asserts
         ------------
             The `add_index` method of the collection schema is called exactly once with the correct parameters.
+            The search algorithm of the client is added to the params of the BM25 index.
+            The given params aren't modified.
         """
         ## Arrange
         params = index_params_list[0]
+        expected_params = {
+            **params,
+            'params': {'inverted_index_algo': 'DAAT_MAXSCORE', **params['params']}
+        }
         # index_params | Create a mock instance of the collection index parameters
         index_params = MagicMock(spec=IndexParams)
-        # MilvusClient | Create a mock instance of the client
-        mock_client = MagicMock(spec=MilvusClient)
         
         ## Act
-        client = MilvusClientInit(uri=uri, client=mock_client)
+        client = MilvusClientInit(uri=uri, client=self.mock_client, inverted_index_algo='DAAT_MAXSCORE')
         client._create_index(index_params=index_params, params=params)
 
         ## Assert
-        index_params.add_index.assert_called_once_with(**params)
+        index_params.add_index.assert_called_once_with(**expected_params)
+        self.assertNotIn('inverted_index_algo', params['params'])
 
 
     ## Test error handling bad schema or params type
@@ -422,24 +648,14 @@ class TestMilvusClientUnit(TestCase):
             Exception is raised when the `_create_index` method is passed wrong argument types.
         """
         ## Arrange
-        invalid_index_params = [
-            ([1], "list"),
-            ([1, 'Hi'], "list with mixed types"),
-            ({1, 'Hi'}, "set"),
-            (1, "integer"),
-            (3.14, "float"),
-            (None, "NoneType"),
-            (True, "boolean")
-        ]
+        invalid_index_params = invalid_types
         invalid_params = invalid_index_params
         valid_params = index_params_list[0]
         # index_params | Create a mock instance of valid collection index parameters
         valid_index_params = MagicMock(spec=IndexParams)
-        # MilvusClient | Create a mock instance of the client
-        mock_client = MagicMock(spec=MilvusClient)        
 
         ## Act
-        client = MilvusClientInit(uri=uri, client=mock_client)
+        client = self.client
 
         ## Act and Assert
         # Run through each invalid index_params with valid params
@@ -486,11 +702,9 @@ class TestMilvusClientUnit(TestCase):
         # index_params | Create a mock instance of the collection index parameters
         index_params = MagicMock(spec=IndexParams)
         index_params.add_index.side_effect = Exception
-        # MilvusClient | Create a mock instance of the client
-        mock_client = MagicMock(spec=MilvusClient)
         
         ## Act
-        client = MilvusClientInit(uri=uri, client=mock_client)
+        client = self.client
 
         ## Assert
         with self.assertRaises(Exception):
@@ -498,11 +712,7 @@ class TestMilvusClientUnit(TestCase):
 
 
     ## Test successful collection listing
-    @patch('pyfiles.milvus_utils.MilvusClient.list_collections')
-    def test_list_collection_success(
-        self, 
-        mock_list
-    ):
+    def test_list_collection_success(self):
         """
         Test successfully listing collections.
         
@@ -522,18 +732,14 @@ class TestMilvusClientUnit(TestCase):
         """
         ## Arrange
         collections_ex = ['collection-0', 'collection-1']
-        # MilvusClient | Create a mock instance of the client
-        mock_client = MagicMock(spec=MilvusClient)
-        # MilvusClient.list_collections | Create a mock instance
-        mock_list.return_value = collections_ex
-        mock_client.list_collections = mock_list
+        # MilvusClient.list_collections | Mock listing collections
+        self.mock_client.list_collections.return_value = collections_ex
 
         ## Act
-        client = MilvusClientInit(uri=uri, client=mock_client)
-        collections = client.list_collections()
+        collections = self.client.list_collections()
 
         ## Assert
-        mock_list.assert_called_once()
+        self.mock_client.list_collections.assert_called_once()
         self.assertEqual(collections, collections_ex)
 
     
@@ -556,37 +762,20 @@ class TestMilvusClientUnit(TestCase):
             Exception is raised when `MilvusClient.list_collections` results in a wrong collections type.
         """
         ## Arrange
-        invalid_collection_lists = [
-            ([1], "list of integers"),
-            ([1, 'Hi'], "list with mixed types"),
-            ({'key': 1, 'value': 'Hi'}, "dictionary"),
-            ({1, 'Hi'}, "set"),
-            (1, "integer"),
-            (3.14, "float"),
-            (None, "NoneType"),
-            (True, "boolean")
-        ]
-        # MilvusClient | Create a mock instance of the client
-        mock_client = MagicMock(spec=MilvusClient)
+        invalid_collection_lists = invalid_types_and_dict
 
-        ## Act
-        MilvusClientInit(uri=uri, client=mock_client)
-
-        ## Assert
+        ## Act and Assert
         # Run through each collection list
         for collection_list, description in invalid_collection_lists:
             with self.subTest(collection_list_type=description):
-                with self.assertRaises(Exception):
-                    mock_list.return_value = collection_list
-                    mock_client.list_collections = mock_list
+                # MilvusClient.list_collections | Mock listing the wrong collections type
+                self.mock_client.list_collections.return_value = collection_list
+                with self.assertRaises(validation_errors):
+                    self.client.list_collections()
 
 
     ## Test failed collection listing
-    @patch('pyfiles.milvus_utils.MilvusClient.list_collections')
-    def test_list_collection_failure(
-        self, 
-        mock_list
-    ):
+    def test_list_collection_failure(self):
         """
         Test failed collection listing.
         
@@ -604,32 +793,98 @@ class TestMilvusClientUnit(TestCase):
             Exception is raised when the `client.list_collections` method fails.
         """
         ## Arrange
-        # MilvusClient | Create a mock instance of the client
-        mock_client = MagicMock(spec=MilvusClient)
-        mock_client.list_collections.side_effect = Exception
+        self.mock_client.list_collections.side_effect = Exception
 
         ## Act
-        client = MilvusClientInit(uri=uri, client=mock_client)
+        client = self.client
         
         ## Assert
         with self.assertRaises(Exception):
             collections = client.list_collections()
 
 
+    ## Test successful collection check
+    def test_has_collection_success(self):
+        """
+        Test successfully checking if a collection exists.
+        
+        Verifications
+        ------------
+            The correct response is obtained from invoking the correct method.
+            The collections cache is updated with the response.
+
+        Mocks
+        ------------
+            `MilvusClient` is mocked and returns a mock instance.
+            `MilvusClient.list_collections` is mocked and returns a mock instance.
+            `MilvusClient.has_collection` is mocked and returns whether the collection exists.
+        
+        Asserts
+        ------------
+            The `MilvusClient.has_collection` method is called exactly once with the correct parameters.
+            The response of `MilvusClient.has_collection` is returned.
+            The collection is in the collections cache only if it exists.
+        """
+        for exists in (True, False):
+            with self.subTest(exists=exists):
+                ## Arrange
+                # MilvusClient | Create a client instance with mocked dependencies
+                mock_client = make_mock_client()
+                mock_client.list_collections.return_value = [] if exists else [collection_name]
+                mock_client.has_collection.return_value = exists
+
+                ## Act
+                client = MilvusClientInit(uri=uri, client=mock_client)
+                client.list_collections()
+                result = client.has_collection(name=collection_name)
+
+                ## Assert
+                mock_client.has_collection.assert_called_once_with(collection_name=collection_name)
+                self.assertEqual(result, exists)
+                self.assertEqual(collection_name in client._collections(), exists)
+                MilvusClientInit.shutdown()
+
+
+    ## Test error handling for bad collection check arguments
+    def test_has_collection_bad_args(self):
+        """
+        Test error handling of checking a collection when passed arguments with the wrong types.
+        
+        Verifications
+        ------------
+            Invoking the method raises an exception when passed wrong argument types.
+            Exception is propagated correctly.
+
+        Mocks
+        ------------
+            `MilvusClient` is mocked and returns a mock instance.
+        
+        Asserts
+        ------------
+            Exception is raised when `MilvusClientInit.has_collection` is passed the wrong argument types.
+        """
+        ## Arrange
+        # name | Create invalid instances
+        invalid_name = invalid_types
+
+        
+        ## Act
+        client = self.client
+
+        ## Assert
+        # Run through each invalid name
+        self._loop_through_params(
+            param_name='name', 
+            param_list=invalid_name, 
+            method_name='has_collection', 
+            method_args={}, 
+            client=client
+        )
+        self.mock_client.has_collection.assert_not_called()
+
+
     ## Test successful collection creation
-    @patch('pyfiles.milvus_utils.MilvusClientInit._create_index')
-    @patch('pyfiles.milvus_utils.MilvusClientInit._create_field')
-    @patch('pyfiles.milvus_utils.MilvusClient.create_collection')
-    @patch('pyfiles.milvus_utils.MilvusClient.prepare_index_params')
-    @patch('pyfiles.milvus_utils.MilvusClient.create_schema')
-    def test_create_collection_success(
-        self, 
-        mock_create_schema, 
-        mock_prepare_index_params, 
-        mock_create_collection, 
-        mock_create_field, 
-        mock_create_index
-    ):
+    def test_create_collection_success(self):
         """
         Test successfully creating a collection.
         
@@ -657,54 +912,48 @@ class TestMilvusClientUnit(TestCase):
             `MilvusClient.prepare_index_params` called once with the correct arguments.
             `MilvusClientInit._create_index` called multiple times with the correct index parameters.
             `MilvusClient.create_collection` called once with the correct arguments.
-            `MilvusClient.list_collections` called twice.
+            `MilvusClient.list_collections` called once, only to check that the collection doesn't exist yet.
+            The new collection is added to the collections cache.
         """
         
         ## Arrange
-        # schema | Create a mock schema instance
-        mock_schema = MagicMock(spec=CollectionSchema)
-        mock_create_schema.return_value = mock_schema
-        # index_params | Create a mock index params
-        mock_index_params = MagicMock(spec=IndexParams)
-        mock_prepare_index_params.return_value = mock_index_params
-        # list_collections | Mock listing collections
-        mock_list = MagicMock()
-        mock_list.side_effect = [[], [collection_name]]
+        # schema, index_params | Use the shared mock schema and index params
+        mock_schema = self.mock_schema
+        mock_index_params = self.mock_index_params
         
-        # MilvusClient | Create a client instance with mocked dependencies
-        mock_client = MagicMock(spec=MilvusClient)
-        mock_client.create_schema = mock_create_schema
-        mock_client.prepare_index_params = mock_prepare_index_params
-        mock_client.create_collection = mock_create_collection
-        mock_client.list_collections = mock_list
+        # MilvusClient | Wire the mocked client's methods
+        self.mock_client.create_schema.return_value = mock_schema
+        self.mock_client.prepare_index_params.return_value = mock_index_params
+        self.mock_client.list_collections.return_value = []
         
         ## Act
-        client = MilvusClientInit(uri=uri, client=mock_client)
-        client.create_collection(
-            name=collection_name, 
-            field_params_list=field_params_list, 
-            func_list=[func_bm25], 
-            index_params_list=index_params_list,
-        )
+        client = self.client
+        # _create_field, _create_index | Patch both helpers at once
+        with patch.multiple(MilvusClientInit, _create_field=DEFAULT, _create_index=DEFAULT) as patches:
+            client.create_collection(
+                name=collection_name, 
+                field_params_list=field_params_list, 
+                func_list=[func_bm25], 
+                index_params_list=index_params_list,
+            )
 
         ## Assert
-        mock_create_schema.assert_called_once_with(enable_dynamic_field=True)
-        expected_field_calls = [call(mock_schema, field_params) for field_params in field_params_list]
-        mock_create_field.assert_has_calls(expected_field_calls)
+        self.mock_client.create_schema.assert_called_once_with(enable_dynamic_field=True)
+        patches['_create_field'].assert_has_calls(self.expected_field_calls)
         mock_schema.add_function.assert_called_once_with(func_bm25)
         
-        mock_prepare_index_params.assert_called_once()
-        expected_index_calls = [call(mock_index_params, index_params) for index_params in index_params_list]
-        mock_create_index.assert_has_calls(expected_index_calls)
+        self.mock_client.prepare_index_params.assert_called_once()
+        patches['_create_index'].assert_has_calls(self.expected_index_calls)
 
-        mock_create_collection.assert_called_once_with(
+        self.mock_client.create_collection.assert_called_once_with(
             collection_name=collection_name,
             schema=mock_schema,
-            index_params=mock_index_params
+            index_params=mock_index_params,
+            consistency_level='Eventually'
         )
 
-        expected_list_calls = [call()]*2
-        mock_list.assert_has_calls(expected_list_calls)
+        self.mock_client.list_collections.assert_called_once()
+        self.assertIn(collection_name, client._collections())
 
 
     ## Test error handling for bad create collection arguments
@@ -728,15 +977,7 @@ class TestMilvusClientUnit(TestCase):
         
         ## Arrange
         # name | Create valid and invalid instances
-        invalid_name = [
-            ([1, 2], "list of integers"),
-            ([1, 'Hi'], "list with mixed types"),
-            ({1, 'Hi'}, "set"),
-            (1, "integer"),
-            (3.14, "float"),
-            (None, "NoneType"),
-            (True, "boolean")
-        ]
+        invalid_name = invalid_types
         valid_name = collection_name
 
         # field_params_list | Create valid and invalid instances
@@ -751,11 +992,9 @@ class TestMilvusClientUnit(TestCase):
         invalid_index_params_list = invalid_name
         valid_index_params_list = index_params_list
 
-        # MilvusClient | Create a client instance
-        mock_client = MagicMock(spec=MilvusClient)
         
         ## Act
-        client = MilvusClientInit(uri=uri, client=mock_client)
+        client = self.client
 
         ## Assert
         # Run through each invalid name
@@ -816,11 +1055,7 @@ class TestMilvusClientUnit(TestCase):
 
     
     ## Test successful dropping of collection
-    @patch('pyfiles.milvus_utils.MilvusClient.drop_collection')
-    def test_drop_collection_success(
-        self, 
-        mock_drop_collection
-    ):
+    def test_drop_collection_success(self):
         """
         Test successfully dropping a collection.
         
@@ -837,27 +1072,21 @@ class TestMilvusClientUnit(TestCase):
         Asserts
         ------------
             The `MilvusClient.drop_collection` method is called exactly once with the correct parameters.
-            The `MilvusClient.list_collections` method is called twice.
+            The `MilvusClient.list_collections` method is called once, only to check that the collection exists.
+            The dropped collection is removed from the collections cache.
         """
         ## Arrange
         # list_collections | Mock listing collections
-        mock_list = MagicMock()
-        mock_list.side_effect = [[collection_name], []]
-        
-        # MilvusClient | Create a client instance with mocked dependencies
-        mock_client = MagicMock(spec=MilvusClient)
-        mock_client.drop_collection = mock_drop_collection
-        mock_client.list_collections = mock_list
+        self.mock_client.list_collections.return_value = [collection_name]
         
         ## Act
-        client = MilvusClientInit(uri=uri, client=mock_client)
-        client.drop_collection(name=collection_name)
+        self.client.drop_collection(name=collection_name)
 
         ## Assert
-        mock_client.drop_collection.assert_called_once_with(collection_name=collection_name)
+        self.mock_client.drop_collection.assert_called_once_with(collection_name=collection_name)
 
-        expected_list_calls = [call()]*2
-        mock_list.assert_has_calls(expected_list_calls)
+        self.mock_client.list_collections.assert_called_once()
+        self.assertNotIn(collection_name, self.client._collections())
 
 
     ## Test error handling for bad drop collection arguments
@@ -881,21 +1110,11 @@ class TestMilvusClientUnit(TestCase):
         
         ## Arrange
         # name | Create valid and invalid instances
-        invalid_name = [
-            ([1, 2], "list of integers"),
-            ([1, 'Hi'], "list with mixed types"),
-            ({1, 'Hi'}, "set"),
-            (1, "integer"),
-            (3.14, "float"),
-            (None, "NoneType"),
-            (True, "boolean")
-        ]
+        invalid_name = invalid_types
 
-        # MilvusClient | Create a client instance
-        mock_client = MagicMock(spec=MilvusClient)
         
         ## Act
-        client = MilvusClientInit(uri=uri, client=mock_client)
+        client = self.client
 
         ## Assert
         # Run through each invalid name
@@ -910,11 +1129,7 @@ class TestMilvusClientUnit(TestCase):
 
 
     ## Test failed dropping of collection
-    @patch('pyfiles.milvus_utils.MilvusClient.drop_collection')
-    def test_drop_collection_failure(
-        self, 
-        mock_drop_collection
-    ):
+    def test_drop_collection_failure(self):
         """
         Test failed collection dropping.
         
@@ -934,28 +1149,18 @@ class TestMilvusClientUnit(TestCase):
         """
         ## Arrange
         # list_collections | Mock listing collections
-        mock_list = MagicMock()
-        mock_list.return_value = [collection_name]
-        
-        # MilvusClient | Create a client instance with mocked dependencies
-        mock_client = MagicMock(spec=MilvusClient)
-        mock_client.drop_collection.side_effect = Exception
-        mock_client.list_collections = mock_list
+        self.mock_client.list_collections.return_value = [collection_name]
         
-        ## Act
-        client = MilvusClientInit(uri=uri, client=mock_client)
+        # MilvusClient | Make the mocked client fail
+        self.mock_client.drop_collection.side_effect = Exception
 
         ## Assert
         with self.assertRaises(Exception):
-            client.drop_collection(name=collection_name)
+            self.client.drop_collection(name=collection_name)
 
 
     ## Test successful inserting of data
-    @patch('pyfiles.milvus_utils.MilvusClient.insert')
-    def test_insert_success(
-        self, 
-        mock_insert
-    ):
+    def test_insert_success(self):
         """
         Test successfully inserting data into a collection.
         
@@ -971,34 +1176,144 @@ class TestMilvusClientUnit(TestCase):
         Asserts
         ------------
             The `MilvusClient.insert` method is called exactly once with the correct parameters.
-            `time.sleep` is called once with the correct parameters.
+            `time.sleep` and `MilvusClient.flush` are not called.
             The `MilvusClient.list_collections` method is called once.
         """
         ## Arrange        
-        # MilvusClient | Create a client instance with mocked dependencies
-        mock_insert.return_value = {}
-        mock_client = MagicMock(spec=MilvusClient)
-        mock_client.insert = mock_insert
+        # MilvusClient | Configure the mocked client
+        self.mock_client.insert.return_value = {}
         # list_collections | Mock listing collections
-        mock_list = MagicMock()
-        mock_list.return_value = [collection_name]
-        mock_client.list_collections = mock_list
+        self.mock_client.list_collections.return_value = [collection_name]
         
         ## Act and Assert
         with patch('pyfiles.milvus_utils.time.sleep') as mock_sleep:
-            client = MilvusClientInit(uri=uri, client=mock_client)
-            client.insert(name=collection_name, data=data_ex)
+            self.client.insert(name=collection_name, data=data_ex)
 
             # Verify insert is called
-            mock_client.insert.assert_called_once_with(
+            self.mock_client.insert.assert_called_once_with(
                 collection_name=collection_name,
-                data=data_ex
+                data=list(data_ex)
             )
 
-            # Verify sleep is called once with the correct argument
-            mock_sleep.assert_called_once_with(0.5)
+            # Verify there's no waiting for the data
+            mock_sleep.assert_not_called()
+            self.mock_client.flush.assert_not_called()
         
-        mock_list.assert_called_once()
+        self.mock_client.list_collections.assert_called_once()
+
+
+    ## Test inserting data and waiting for it to be flushed
+    def test_insert_wait_for_flush(self):
+        """
+        Test inserting data into a collection and waiting for it to be flushed.
+        
+        Verifications
+        ------------
+            The data is flushed after being inserted.
+
+        Mocks
+        ------------
+            `MilvusClient` is mocked and returns a mock instance.
+        
+        Asserts
+        ------------
+            The `MilvusClient.flush` method is called exactly once with the correct parameters after `MilvusClient.insert`.
+        """
+        ## Arrange        
+        self.mock_client.insert.return_value = {}
+        self.mock_client.list_collections.return_value = [collection_name]
+        
+        ## Act
+        client = self.client
+        client.insert(name=collection_name, data=data_ex, wait_for_flush=True)
+
+        ## Assert
+        self.mock_client.flush.assert_called_once_with(collection_name=collection_name)
+        self.assertEqual(
+            [method_call[0] for method_call in self.mock_client.method_calls[-2:]],
+            ['insert', 'flush']
+        )
+
+    
+    ## Test inserting deduplicated data in batches
+    def test_insert_batched_deduplicated(self):
+        """
+        Test inserting data into a collection in batches while skipping duplicate rows.
+        
+        Verifications
+        ------------
+            Rows with the same text as an earlier row are skipped.
+            The data is sent in batches of at most `batch_size` rows.
+            The results of all batches are merged.
+
+        Mocks
+        ------------
+            `MilvusClient` is mocked and returns a mock instance.
+        
+        Asserts
+        ------------
+            The `MilvusClient.insert` method is called once per batch with the deduplicated rows.
+            The merged results hold the insert count and ids of all batches.
+        """
+        ## Arrange
+        data = [
+            {'text': 'a'},
+            {'text': 'b'},
+            {'text': 'a'},
+            {'text': 'c'},
+            {'id_only': 1}
+        ]
+
+        self.mock_client.insert.side_effect = [
+            {'insert_count': 2, 'ids': [1, 2]},
+            {'insert_count': 2, 'ids': [3, 4]}
+        ]
+        self.mock_client.list_collections.return_value = [collection_name]
+        
+        ## Act
+        client = self.client
+        results = client.insert(name=collection_name, data=data, batch_size=2, deduplicate=True)
+
+        ## Assert
+        self.mock_client.insert.assert_has_calls([
+            call(collection_name=collection_name, data=[{'text': 'a'}, {'text': 'b'}]),
+            call(collection_name=collection_name, data=[{'text': 'c'}, {'id_only': 1}])
+        ])
+        self.assertEqual(results, {'insert_count': 4, 'ids': [1, 2, 3, 4]})
+
+    
+    ## Test inserting data given as columns
+    def test_insert_columns(self):
+        """
+        Test inserting data into a collection when the data is given as columns.
+        
+        Verifications
+        ------------
+            The columns are converted to rows before being inserted.
+
+        Mocks
+        ------------
+            `MilvusClient` is mocked and returns a mock instance.
+        
+        Asserts
+        ------------
+            The `MilvusClient.insert` method is called exactly once with the rows of the columns.
+        """
+        ## Arrange
+        columns = {'text': [row['text'] for row in data_ex]}
+
+        self.mock_client.insert.return_value = {}
+        self.mock_client.list_collections.return_value = [collection_name]
+        
+        ## Act
+        client = self.client
+        client.insert(name=collection_name, data=columns)
+
+        ## Assert
+        self.mock_client.insert.assert_called_once_with(
+            collection_name=collection_name,
+            data=list(data_ex)
+        )
 
     
     ## Test error handling for bad insert arguments
@@ -1022,25 +1337,18 @@ class TestMilvusClientUnit(TestCase):
         
         ## Arrange
         # name | Create valid and invalid instances
-        invalid_name = [
-            ([1, 2], "list of integers"),
-            ([1, 'Hi'], "list with mixed types"),
-            ({1, 'Hi'}, "set"),
-            (1, "integer"),
-            (3.14, "float"),
-            (None, "NoneType"),
-            (True, "boolean")
-        ]
+        invalid_name = invalid_types
         valid_name = collection_name
 
-        invalid_data = invalid_name
+        invalid_data = invalid_insert_data
         valid_data = data_ex
 
-        # MilvusClient | Create a client instance
-        mock_client = MagicMock(spec=MilvusClient)
+        invalid_batch_size = invalid_positive_ints
+        invalid_deduplicate = invalid_bools
+
         
         ## Act
-        client = MilvusClientInit(uri=uri, client=mock_client)
+        client = self.client
 
         ## Assert
         # Run through each invalid name
@@ -1063,13 +1371,29 @@ class TestMilvusClientUnit(TestCase):
             client=client
         )
 
+        # Run through each invalid batch size
+        method_args = {"name": valid_name, "data": valid_data}
+        self._loop_through_params(
+            param_name='batch_size', 
+            param_list=invalid_batch_size, 
+            method_name='insert', 
+            method_args=method_args, 
+            client=client
+        )
+
+        # Run through each invalid deduplicate flag
+        method_args = {"name": valid_name, "data": valid_data}
+        self._loop_through_params(
+            param_name='deduplicate', 
+            param_list=invalid_deduplicate, 
+            method_name='insert', 
+            method_args=method_args, 
+            client=client
+        )
+
 
     ## Test failed inserting of data
-    @patch('pyfiles.milvus_utils.MilvusClient.insert')
-    def test_insert_failure(
-        self, 
-        mock_insert
-    ):
+    def test_insert_failure(self):
         """
         Test failed data insert.
         
@@ -1088,28 +1412,202 @@ class TestMilvusClientUnit(TestCase):
             Exception is raised when the `client.insert` method fails.
         """
         ## Arrange        
-        # MilvusClient | Create a client instance with mocked dependencies
-        mock_client = MagicMock(spec=MilvusClient)
-        mock_client.insert.side_effect = Exception
+        # MilvusClient | Make the mocked client fail
+        self.mock_client.insert.side_effect = Exception
         # list_collections | Mock listing collections
-        mock_list = MagicMock()
-        mock_list.return_value = [collection_name]
-        mock_client.list_collections = mock_list
+        self.mock_client.list_collections.return_value = [collection_name]
+
+        ## Assert
+        with self.assertRaises(Exception):
+            self.client.insert(name=collection_name, data=data_ex)
+
+
+    ## Test successful inserting of data from a JSON Lines file
+    def test_insert_from_jsonl_success(self):
+        """
+        Test successfully inserting data from a JSON Lines file into a collection.
+        
+        Verifications
+        ------------
+            The rows of the file are inserted in batches of the given size.
+
+        Mocks
+        ------------
+            `MilvusClient` is mocked and returns a mock instance.
+        
+        Asserts
+        ------------
+            The `MilvusClient.insert` method is called once per batch with the correct rows.
+            The total number of inserted rows is returned.
+        """
+        ## Arrange
+        # JSON Lines file | Write the example data with a blank line at the end
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'data.jsonl')
+            with open(path, 'w', encoding='UTF-8') as file:
+                file.writelines(json.dumps(row) + '\n' for row in data_ex)
+                file.write('\n')
+
+            # MilvusClient | Configure the mocked client
+            self.mock_client.insert.side_effect = lambda collection_name, data: {'insert_count': len(data)}
+            self.mock_client.list_collections.return_value = [collection_name]
+
+            ## Act
+            results = self.client.insert_from_jsonl(path=path, name=collection_name, batch_size=2)
+
+        ## Assert
+        self.mock_client.insert.assert_has_calls([
+            call(collection_name=collection_name, data=list(data_ex[0:2])),
+            call(collection_name=collection_name, data=list(data_ex[2:4])),
+            call(collection_name=collection_name, data=list(data_ex[4:5]))
+        ])
+        self.assertEqual(self.mock_client.insert.call_count, 3)
+        self.assertEqual(results, {'insert_count': len(data_ex)})
+
+
+    ## Test successful deleting of data
+    def test_delete_success(self):
+        """
+        Test successfully deleting data from a collection.
         
+        Verifications
+        ------------
+            The correct method is called with the correct parameters.
+
+        Mocks
+        ------------
+            `MilvusClient` is mocked and returns a mock instance.
+            `MilvusClient.delete` is mocked and returns a mock instance.
+        
+        Asserts
+        ------------
+            The `MilvusClient.delete` method is called exactly once with the correct parameters.
+            `MilvusClient.flush` is not called.
+            The `MilvusClient.list_collections` method is called once.
+        """
+        ## Arrange
+        ids = ['id-1', 'id-2']
+        # MilvusClient | Configure the mocked client
+        self.mock_client.delete.return_value = {}
+        # list_collections | Mock listing collections
+        self.mock_client.list_collections.return_value = [collection_name]
+
         ## Act
-        client = MilvusClientInit(uri=uri, client=mock_client)
+        self.client.delete(ids=ids, name=collection_name)
 
         ## Assert
-        with self.assertRaises(Exception):
-            client.insert(name=collection_name, data=data_ex)
+        self.mock_client.delete.assert_called_once_with(
+            collection_name=collection_name,
+            ids=ids
+        )
+        # Verify there's no waiting for the deletion
+        self.mock_client.flush.assert_not_called()
+
+        self.mock_client.list_collections.assert_called_once()
+
+
+    ## Test deleting data and waiting for it to be flushed
+    def test_delete_wait_for_flush(self):
+        """
+        Test deleting data from a collection and waiting for the deletion to be flushed.
+        
+        Verifications
+        ------------
+            The deletion is flushed after the data is deleted.
+
+        Mocks
+        ------------
+            `MilvusClient` is mocked and returns a mock instance.
+        
+        Asserts
+        ------------
+            The `MilvusClient.flush` method is called exactly once with the correct parameters after `MilvusClient.delete`.
+        """
+        ## Arrange
+        self.mock_client.delete.return_value = {}
+        self.mock_client.list_collections.return_value = [collection_name]
+
+        ## Act
+        client = self.client
+        client.delete(ids=['id-1'], name=collection_name, wait_for_flush=True)
+
+        ## Assert
+        self.mock_client.flush.assert_called_once_with(collection_name=collection_name)
+        self.assertEqual(
+            [method_call[0] for method_call in self.mock_client.method_calls[-2:]],
+            ['delete', 'flush']
+        )
+
+
+    ## Test error handling for bad delete arguments
+    def test_delete_bad_args(self):
+        """
+        Test error handling of deleting data when passed arguments with the wrong types.
+        
+        Verifications
+        ------------
+            Invoking the method raises an exception when passed wrong argument types.
+            Exception is propagated correctly.
+
+        Mocks
+        ------------
+            `MilvusClient` is mocked and returns a mock instance.
+        
+        Asserts
+        ------------
+            Exception is raised when `MilvusClientInit.delete` is passed the wrong argument types.
+        """
+        
+        ## Arrange
+        # name | Create valid and invalid instances
+        invalid_name = invalid_types
+        valid_name = collection_name
+
+        invalid_ids = invalid_types
+        valid_ids = ['id-1']
+
+        invalid_wait_for_flush = invalid_bools
+
+        
+        ## Act
+        client = self.client
+
+        ## Assert
+        # Run through each invalid name
+        method_args = {"ids": valid_ids}
+        self._loop_through_params(
+            param_name='name', 
+            param_list=invalid_name, 
+            method_name='delete', 
+            method_args=method_args, 
+            client=client
+        )
+
+        # Run through each invalid list of ids
+        method_args = {"name": valid_name}
+        self._loop_through_params(
+            param_name='ids', 
+            param_list=invalid_ids, 
+            method_name='delete', 
+            method_args=method_args, 
+            client=client
+        )
+
+        # Run through each invalid wait for flush flag
+        method_args = {"name": valid_name, "ids": valid_ids}
+        self._loop_through_params(
+            param_name='wait_for_flush', 
+            param_list=invalid_wait_for_flush, 
+            method_name='delete', 
+            method_args=method_args, 
+            client=client
+        )
+
+        self.mock_client.delete.assert_not_called()
 
 
     ## Test successful full text search
-    @patch('pyfiles.milvus_utils.MilvusClient.search')
-    def test_full_text_search_success(
-        self, 
-        mock_search
-    ):
+    def test_full_text_search_success(self):
         """
         Test successfully performing a full text search.
         
@@ -1130,49 +1628,40 @@ class TestMilvusClientUnit(TestCase):
             The `MilvusClient.list_collections` method is called once.
         """
         ## Arrange        
-        anns_field = 'sparse'
-        output_fields = ['text']
-        search_params = {
-            'params': {'drop_ratio_search': 0.2},
-        }
-
         # Results | Create a mock result
         # SearchResult is list of HybridHits
         # HybridHits is list of Hit
-        mock_hit = MagicMock(spec=Hit)
-        mock_hybrid_hits = MagicMock(spec=HybridHits)
+        # Only the SearchResult needs a spec, to pass the type check of the results
+        mock_hit = MagicMock()
+        mock_hybrid_hits = MagicMock()
         mock_hybrid_hits.return_value = [mock_hit]
         mock_search_result = MagicMock(spec=SearchResult)
         mock_search_result.return_value = [mock_hybrid_hits]
         
-        # MilvusClient | Create a client instance with mocked dependencies
-        mock_client = MagicMock(spec=MilvusClient)
-        mock_search.return_value = mock_search_result
-        mock_client.search = mock_search
+        # MilvusClient | Configure the mocked client
+        self.mock_client.search.return_value = mock_search_result
 
         # list_collections | Mock listing collections
-        mock_list = MagicMock()
-        mock_list.return_value = [collection_name]
-        mock_client.list_collections = mock_list
+        self.mock_client.list_collections.return_value = [collection_name]
         
         ## Act
-        client = MilvusClientInit(uri=uri, client=mock_client)
-        client.full_text_search(
+        self.client.full_text_search(
             name = collection_name, 
             query_list = query_list, 
             limit = lim_results
         )
 
         ## Assert
-        mock_client.search.assert_called_once_with(
+        self.mock_client.search.assert_called_once_with(
             collection_name=collection_name, 
-            data=query_list,
-            anns_field=anns_field,
-            output_fields=output_fields,
+            data=list(query_list),
+            anns_field=expected_anns_field,
+            output_fields=list(expected_output_fields),
             limit=lim_results,
-            search_params=search_params
+            search_params=expected_search_params,
+            consistency_level='Eventually'
         )
-        mock_list.assert_called_once()
+        self.mock_client.list_collections.assert_called_once()
 
 
     ## Test error handling for bad full text search arguments
@@ -1192,19 +1681,12 @@ class TestMilvusClientUnit(TestCase):
         Asserts
         ------------
             Exception is raised when `MilvusClientInit.full_text_search` is passed the wrong argument types.
-            The `MilvusClient.list_collections` method is called once.
+            The `MilvusClient.list_collections` method is never called, as every bad argument is rejected first.
         """
         
         ## Arrange
         # name | Create valid and invalid instances
-        invalid_name = [
-            ([1, 2], "list of integers"),
-            ([1, 'Hi'], "list with mixed types"),
-            ({1, 'Hi'}, "set"),
-            (3.14, "float"),
-            (None, "NoneType"),
-            (True, "boolean")
-        ]
+        invalid_name = invalid_types_but_int
         valid_name = collection_name
 
         invalid_query_list = invalid_name
@@ -1213,15 +1695,13 @@ class TestMilvusClientUnit(TestCase):
         invalid_limit = invalid_name
         valid_limit = lim_results
 
-        # MilvusClient | Create a client instance
-        mock_client = MagicMock(spec=MilvusClient)
+        invalid_consistency_level = invalid_search_consistency_levels
+
         # list_collections | Mock listing collections
-        mock_list = MagicMock()
-        mock_list.return_value = [collection_name]
-        mock_client.list_collections = mock_list
+        self.mock_client.list_collections.return_value = [collection_name]
         
         ## Act
-        client = MilvusClientInit(uri=uri, client=mock_client)
+        client = self.client
 
         ## Assert
         # Run through each invalid name
@@ -1254,4 +1734,493 @@ class TestMilvusClientUnit(TestCase):
             client=client
         )
 
-        mock_list.assert_called_once()
\ No newline at end of file
+        # Run through each invalid consistency level
+        method_args = {"name": valid_name, "query_list": valid_query_list, "limit": valid_limit}
+        self._loop_through_params(
+            param_name='consistency_level', 
+            param_list=invalid_consistency_level, 
+            method_name='full_text_search', 
+            method_args=method_args, 
+            client=client
+        )
+
+        self.mock_client.list_collections.assert_not_called()
+
+    ## Test reusing cached full text search results
+    def test_full_text_search_cache(self):
+        """
+        Test that the results of repeated queries are reused until the collection data changes.
+        
+        Verifications
+        ------------
+            Only the queries without cached results are sent to the Milvus server.
+            The results are returned in the order of the queries.
+            Inserting data into the collection clears its cached results.
+
+        Mocks
+        ------------
+            `MilvusClient` is mocked and returns a mock instance.
+            `HybridHits` is mocked to populate the `SearchResult` return values.
+        
+        Asserts
+        ------------
+            The `search` method of the `MilvusClient` is only called with the uncached queries.
+            The results hold the hits of each query in order.
+            The `search` method of the `MilvusClient` isn't called when all queries are cached.
+        """
+        ## Arrange
+        hits = {query: MagicMock(spec=HybridHits) for query in ['a', 'b', 'c']}
+        # Empty results aren't cached, so each query has a hit
+        for query_hits in hits.values():
+            query_hits.__len__.return_value = 1
+
+        def search_side_effect(**kwargs):
+            results = SearchResult(SearchResultData())
+            results.extend(hits[query] for query in kwargs['data'])
+            return results
+
+        self.mock_client.search.side_effect = search_side_effect
+        self.mock_client.insert.return_value = {'insert_count': 1}
+        self.mock_client.list_collections.return_value = [collection_name]
+
+        ## Act
+        client = self.client
+        client.full_text_search(name=collection_name, query_list=['a', 'b'], limit=lim_results)
+        results = client.full_text_search(name=collection_name, query_list=['b', 'c', 'a'], limit=lim_results)
+        client.full_text_search(name=collection_name, query_list=['a'], limit=lim_results)
+        client.insert(name=collection_name, data=data_ex)
+        client.full_text_search(name=collection_name, query_list=['a'], limit=lim_results)
+
+        ## Assert
+        sent_queries = [search_call.kwargs['data'] for search_call in self.mock_client.search.call_args_list]
+        self.assertEqual(sent_queries, [['a', 'b'], ['c'], ['a']])
+        self.assertIsInstance(results, SearchResult)
+        self.assertEqual(list(results), [hits['b'], hits['c'], hits['a']])
+
+
+    ## Test full text searches that don't reuse cached results
+    @patch('pyfiles.milvus_utils.time.monotonic')
+    def test_full_text_search_cache_skipped(
+        self, 
+        mock_monotonic
+    ):
+        """
+        Test that results which may be stale aren't reused by repeated queries.
+        
+        Verifications
+        ------------
+            Searches with the 'Strong' consistency level never use the cache.
+            Empty results aren't cached.
+            Cached results are searched again after the results cache TTL.
+
+        Mocks
+        ------------
+            `MilvusClient` is mocked and returns a mock instance.
+            `HybridHits` is mocked to populate the `SearchResult` return values.
+            `time.monotonic` is mocked to move past the results cache TTL.
+        
+        Asserts
+        ------------
+            The `search` method of the `MilvusClient` is called for every repeated query.
+        """
+        ## Arrange
+        hits = MagicMock(spec=HybridHits)
+        hits.__len__.return_value = 1
+        empty_hits = MagicMock(spec=HybridHits)
+        empty_hits.__len__.return_value = 0
+
+        def search_side_effect(**kwargs):
+            results = SearchResult(SearchResultData())
+            results.extend(empty_hits if query == 'empty' else hits for query in kwargs['data'])
+            return results
+
+        self.mock_client.search.side_effect = search_side_effect
+        self.mock_client.list_collections.return_value = [collection_name]
+        mock_monotonic.return_value = 100.0
+        client = self.client
+        searches = {
+            'strong': {'query_list': ['a'], 'consistency_level': 'Strong'},
+            'empty': {'query_list': ['empty'], 'consistency_level': 'Eventually'}
+        }
+
+        for search_name, search_args in searches.items():
+            with self.subTest(search=search_name):
+                self.mock_client.search.reset_mock()
+
+                ## Act
+                client.full_text_search(name=collection_name, limit=lim_results, **search_args)
+                client.full_text_search(name=collection_name, limit=lim_results, **search_args)
+
+                ## Assert
+                self.assertEqual(self.mock_client.search.call_count, 2)
+
+        with self.subTest(search='expired'):
+            self.mock_client.search.reset_mock()
+
+            ## Act
+            client.full_text_search(name=collection_name, query_list=['b'], limit=lim_results)
+            mock_monotonic.return_value = 100.0 + results_cache_ttl / 2
+            client.full_text_search(name=collection_name, query_list=['b'], limit=lim_results)
+            mock_monotonic.return_value = 100.0 + results_cache_ttl
+            client.full_text_search(name=collection_name, query_list=['b'], limit=lim_results)
+
+            ## Assert
+            self.assertEqual(self.mock_client.search.call_count, 2)
+
+
+    ## Test full text searches that don't cache results after writes
+    @patch('pyfiles.milvus_utils.time.monotonic')
+    def test_full_text_search_cache_writes(
+        self, 
+        mock_monotonic
+    ):
+        """
+        Test that results which may be missing data written through the client aren't cached.
+        
+        Verifications
+        ------------
+            Results searched while data is written to the collection aren't cached.
+            'Eventually' results searched within the write window after a write aren't cached.
+            'Eventually' results are cached again after the write window.
+            'Bounded' results searched right after a write are cached.
+
+        Mocks
+        ------------
+            `MilvusClient` is mocked and returns a mock instance.
+            `HybridHits` is mocked to populate the `SearchResult` return values.
+            `time.monotonic` is mocked to move past the write window.
+        
+        Asserts
+        ------------
+            The `search` method of the `MilvusClient` is only skipped for queries with cached results.
+        """
+        ## Arrange
+        hits = MagicMock(spec=HybridHits)
+        hits.__len__.return_value = 1
+        client = self.client
+        # Data is written while the first search is running
+        writes = iter([lambda: client.insert(name=collection_name, data=data_ex)])
+
+        def search_side_effect(**kwargs):
+            next(writes, lambda: None)()
+            results = SearchResult(SearchResultData())
+            results.extend(hits for _ in kwargs['data'])
+            return results
+
+        self.mock_client.search.side_effect = search_side_effect
+        self.mock_client.insert.return_value = {'insert_count': 1}
+        self.mock_client.list_collections.return_value = [collection_name]
+        mock_monotonic.return_value = 100.0
+        search_args = {'name': collection_name, 'limit': lim_results}
+
+        with self.subTest(search='write during search'):
+            ## Act
+            client.full_text_search(query_list=['a'], consistency_level='Bounded', **search_args)
+            client.full_text_search(query_list=['a'], consistency_level='Bounded', **search_args)
+            client.full_text_search(query_list=['a'], consistency_level='Bounded', **search_args)
+
+            ## Assert
+            self.assertEqual(self.mock_client.search.call_count, 2)
+
+        with self.subTest(search='eventually after write'):
+            self.mock_client.search.reset_mock()
+
+            ## Act
+            mock_monotonic.return_value = 100.0 + results_cache_write_window / 2
+            client.full_text_search(query_list=['b'], consistency_level='Eventually', **search_args)
+            client.full_text_search(query_list=['b'], consistency_level='Eventually', **search_args)
+            mock_monotonic.return_value = 100.0 + results_cache_write_window
+            client.full_text_search(query_list=['b'], consistency_level='Eventually', **search_args)
+            client.full_text_search(query_list=['b'], consistency_level='Eventually', **search_args)
+
+            ## Assert
+            self.assertEqual(self.mock_client.search.call_count, 3)
+
+        with self.subTest(search='bounded after write'):
+            self.mock_client.search.reset_mock()
+
+            ## Act
+            client.insert(name=collection_name, data=data_ex)
+            client.full_text_search(query_list=['c'], consistency_level='Bounded', **search_args)
+            client.full_text_search(query_list=['c'], consistency_level='Bounded', **search_args)
+
+            ## Assert
+            self.assertEqual(self.mock_client.search.call_count, 1)
+
+
+    ## Test writes clearing the cached full text search results
+    def test_results_cache_cleared(self):
+        """
+        Test that deleting data from or dropping a collection clears its cached results.
+        
+        Verifications
+        ------------
+            Deleting data from a collection clears its cached results.
+            Dropping a collection clears its cached results.
+
+        Mocks
+        ------------
+            `MilvusClient` is mocked and returns a mock instance.
+            `HybridHits` is mocked to populate the `SearchResult` return values.
+        
+        Asserts
+        ------------
+            The results of the collection are cached before the write, and aren't after.
+        """
+        ## Arrange
+        hits = MagicMock(spec=HybridHits)
+        hits.__len__.return_value = 1
+
+        def search_side_effect(**kwargs):
+            results = SearchResult(SearchResultData())
+            results.extend(hits for _ in kwargs['data'])
+            return results
+
+        self.mock_client.search.side_effect = search_side_effect
+        self.mock_client.delete.return_value = {}
+        self.mock_client.list_collections.return_value = [collection_name]
+        client = self.client
+        key = (collection_name, 'a', lim_results, 'Bounded')
+        # The collection is dropped last, since it can't be searched afterwards
+        writes = {
+            'delete': lambda: client.delete(ids=['id'], name=collection_name),
+            'drop_collection': lambda: client.drop_collection(name=collection_name)
+        }
+
+        for write_name, write in writes.items():
+            with self.subTest(write=write_name):
+                ## Act
+                client.full_text_search(name=collection_name, query_list=['a'], limit=lim_results, consistency_level='Bounded')
+                self.assertIn(key, client._results_cache)
+                write()
+
+                ## Assert
+                self.assertNotIn(key, client._results_cache)
+
+
+    ## Test the results cache is only used while holding its lock
+    def test_results_cache_lock(self):
+        """
+        Test that every read and write of the results cache waits for the cache lock.
+        
+        Verifications
+        ------------
+            Caching, clearing, and looking up results can't collide with another thread changing the cache.
+
+        Mocks
+        ------------
+            `MilvusClient` is mocked and returns a mock instance.
+        
+        Asserts
+        ------------
+            Each cache operation blocks while the lock is held by another thread.
+            Each cache operation finishes once the lock is released.
+        """
+        ## Arrange
+        self.mock_client.list_collections.return_value = [collection_name]
+        self.mock_client.search.side_effect = lambda **kwargs: SearchResult(SearchResultData())
+        key = (collection_name, 'a', lim_results, 'Eventually')
+        client = self.client
+        operations = {
+            'cache': lambda: client._cache_results(key, [MagicMock()], 0),
+            'clear': lambda: client._clear_results_cache(collection_name),
+            'lookup': lambda: client.full_text_search(name=collection_name, query_list=['a'], limit=lim_results)
+        }
+
+        for operation_name, operation in operations.items():
+            with self.subTest(operation=operation_name):
+                ## Act
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    with client._results_cache_lock:
+                        future = executor.submit(operation)
+                        done, _ = wait([future], timeout=0.1)
+
+                        ## Assert
+                        self.assertFalse(done)
+                    future.result(timeout=1)
+
+
+    ## Test successful batched full text search
+    def test_full_text_search_batched_success(self):
+        """
+        Test successfully performing a batched full text search.
+        
+        Verifications
+        ------------
+            The queries are split into batches and each batch is sent in a single request.
+            Batches sent concurrently are put back in the order of the queries.
+
+        Mocks
+        ------------
+            `MilvusClient` is mocked and returns a mock instance.
+            `SearchResult` is mocked as the return value for the `MilvusClient.search` method.
+        
+        Asserts
+        ------------
+            The `search` method of the `MilvusClient` is called once per batch with the correct queries.
+            The results of later batches are added to the results of the first batch in order.
+        """
+        ## Arrange
+        queries = ['query 0', 'query 1', 'query 2', 'query 3', 'query 4']
+        batch_size = 2
+
+        # Results | Create a mock result for each batch
+        # Batches may be searched in any order, so results are looked up by their first query
+        mock_search_results = [MagicMock(spec=SearchResult) for _ in range(3)]
+        results_by_query = dict(zip(queries[::batch_size], mock_search_results))
+        
+        # MilvusClient | Configure the mocked client
+        self.mock_client.search.side_effect = lambda **kwargs: results_by_query[kwargs['data'][0]]
+
+        # list_collections | Mock listing collections
+        self.mock_client.list_collections.return_value = [collection_name]
+        
+        ## Act
+        results = self.client.full_text_search_batched(
+            name = collection_name, 
+            query_list = queries, 
+            limit = lim_results,
+            batch_size = batch_size
+        )
+
+        ## Assert
+        sent_batches = [search_call.kwargs['data'] for search_call in self.mock_client.search.call_args_list]
+        self.assertCountEqual(sent_batches, [queries[0:2], queries[2:4], queries[4:5]])
+        self.assertIs(results, mock_search_results[0])
+        mock_search_results[0].extend.assert_has_calls(
+            [call(mock_search_results[1]), call(mock_search_results[2])]
+        )
+        self.mock_client.list_collections.assert_called_once()
+
+
+    ## Test error handling for bad batched full text search arguments
+    def test_full_text_search_batched_bad_args(self):
+        """
+        Test error handling of performing a batched full text search when passed a bad batch size or number of workers.
+        
+        Verifications
+        ------------
+            Invoking the method raises an exception when passed a batch size or number of workers that isn't a positive integer.
+            Exception is propagated correctly.
+
+        Mocks
+        ------------
+            `MilvusClient` is mocked and returns a mock instance.
+        
+        Asserts
+        ------------
+            Exception is raised when `MilvusClientInit.full_text_search_batched` is passed a bad batch size or number of workers.
+        """
+        ## Arrange
+        invalid_batch_size = invalid_positive_ints
+
+        # list_collections | Mock listing collections
+        self.mock_client.list_collections.return_value = [collection_name]
+        
+        ## Act
+        client = self.client
+
+        ## Assert
+        # Run through each invalid batch size
+        method_args = {"name": collection_name, "query_list": query_list, "limit": lim_results}
+        self._loop_through_params(
+            param_name='batch_size', 
+            param_list=invalid_batch_size, 
+            method_name='full_text_search_batched', 
+            method_args=method_args, 
+            client=client
+        )
+
+        # Run through each invalid number of workers
+        method_args = {"name": collection_name, "query_list": query_list, "limit": lim_results}
+        self._loop_through_params(
+            param_name='max_workers', 
+            param_list=invalid_batch_size, 
+            method_name='full_text_search_batched', 
+            method_args=method_args, 
+            client=client
+        )
+        self.mock_client.search.assert_not_called()
+
+
+    ## Test reusing listed collections for existence checks
+    @patch('pyfiles.milvus_utils.time.monotonic')
+    def test_collections_cache(
+        self, 
+        mock_monotonic
+    ):
+        """
+        Test that the listed collections are reused for existence checks until the cache expires.
+        
+        Verifications
+        ------------
+            Collections aren't listed again for existence checks made within `collections_cache_ttl` seconds.
+            Collections are listed again once the cache expires.
+
+        Mocks
+        ------------
+            `MilvusClient` is mocked and returns a mock instance.
+            `MilvusClient.list_collections` is mocked and returns a mock instance.
+            `time.monotonic` is mocked to control the age of the cache.
+        
+        Asserts
+        ------------
+            The `MilvusClient.list_collections` method is called once for two inserts within the cache TTL.
+            The `MilvusClient.list_collections` method is called again for an insert after the cache TTL.
+        """
+        ## Arrange
+        # MilvusClient | Configure the mocked client
+        self.mock_client.insert.return_value = {}
+        # list_collections | Mock listing collections
+        mock_list = self.mock_client.list_collections
+        mock_list.return_value = [collection_name]
+
+        ## Act and Assert
+        client = self.client
+        # Two inserts within the cache TTL
+        mock_monotonic.return_value = 100.0
+        client.insert(name=collection_name, data=data_ex)
+        mock_monotonic.return_value = 100.0 + collections_cache_ttl / 2
+        client.insert(name=collection_name, data=data_ex)
+        mock_list.assert_called_once()
+
+        # One insert after the cache TTL
+        mock_monotonic.return_value = 100.0 + collections_cache_ttl
+        client.insert(name=collection_name, data=data_ex)
+        self.assertEqual(mock_list.call_count, 2)
+
+
+    ## Test checking collections while another thread clears the cache
+    def test_collections_cache_cleared(self):
+        """
+        Test getting the collection names when the collections cache is cleared right after it's refreshed.
+        
+        Verifications
+        ------------
+            A failure in another thread clearing the cache doesn't break existence checks.
+
+        Mocks
+        ------------
+            `MilvusClient` is mocked and returns a mock instance.
+            `MilvusClientInit.list_collections` is wrapped to clear the cache after listing the collections.
+        
+        Asserts
+        ------------
+            The listed collection names are returned even though the cache was cleared.
+        """
+        ## Arrange
+        self.mock_client.list_collections.return_value = [collection_name]
+        client = self.client
+        list_collections = client.list_collections
+
+        def list_then_clear():
+            collections = list_collections()
+            client._collections_cache = None
+            return collections
+
+        ## Act
+        with patch.object(client, 'list_collections', side_effect=list_then_clear):
+            collections = client._collections()
+
+        ## Assert
+        self.assertEqual(collections, {collection_name})
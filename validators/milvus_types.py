@@ -5,16 +5,16 @@
 # Third-party modules
 from pydantic import (
     BaseModel, 
+    ConfigDict,
+    Field,
+    NonNegativeInt,
+    PositiveInt,
     field_validator
 )
 
-from pymilvus.milvus_client.index import IndexParams # type: ignore
 from pymilvus import ( # type: ignore
     MilvusClient,       
-    CollectionSchema,   
-    Function,           
-    FunctionType,       
-    DataType            
+    Function            
 ) 
 from pymilvus.client.search_result import ( # type: ignore
     SearchResult, 
@@ -24,14 +24,47 @@ from pymilvus.client.search_result import ( # type: ignore
 
 from typing import (
     List, 
+    Tuple,
+    Literal,
+    Annotated,
     Any
 )
+from itertools import repeat
+
+
+## Consistency levels accepted by the Milvus server
+ConsistencyLevel = Literal['Strong', 'Bounded', 'Session', 'Eventually']
+
+## Algorithms the Milvus server can use to search BM25 indices
+InvertedIndexAlgo = Literal['DAAT_WAND', 'DAAT_MAXSCORE', 'TAAT_NAIVE']
 
-# Internal modules
-from pyfiles.logger import (
-    logger, 
-    with_spinner
-)
+
+def check_type(
+    value: Any, 
+    expected_type: type, 
+    arg_name: str
+) -> None:
+    """
+    Check the type of a single argument without building a pydantic model.
+    
+    This is used for private methods that are called many times from a public method whose arguments are already validated.
+
+    Args
+    ------------
+        value: Any
+            The argument to check.
+        expected_type: type
+            The type the argument should have.
+        arg_name: str
+            The name of the argument, used in the error message.
+        
+    Raises
+    ------------
+        TypeError: 
+            If the argument doesn't have the expected type, error is raised.
+    """
+    if not isinstance(value, expected_type):
+        raise TypeError(f"The `{arg_name}` argument should be a `{expected_type.__name__}`, instead got {type(value)}.")
 
 
 class InitClientParams(BaseModel):
@@ -42,17 +75,22 @@ class InitClientParams(BaseModel):
     ------------
         uri: str
             The URI of the Milvus server, e.g., 'http://localhost:19530'.
+        inverted_index_algo: str
+            The algorithm used to search BM25 indices.
+        drop_ratio_search: float
+            The proportion of the smallest values to drop from the query vectors when searching.
+        results_cache_size: int
+            The maximum number of query results to cache.
+        compression: bool
+            Whether to compress the connection to the Milvus server.
     """
-    uri: str
+    model_config = ConfigDict(strict=True)
 
-    @field_validator('uri')
-    @classmethod
-    def validate_uri(cls, v: str) -> str:
-        if not isinstance(v, str):
-            error_message = f"The `uri` argument should be a string, instead got `{type(v)}`."
-            logger.error(error_message)
-            raise TypeError(error_message)
-        return v
+    uri: str
+    inverted_index_algo: InvertedIndexAlgo
+    drop_ratio_search: Annotated[float, Field(ge=0, lt=1)]
+    results_cache_size: NonNegativeInt
+    compression: bool
 
 
 class InitClientResults(BaseModel):
@@ -70,75 +108,7 @@ class InitClientResults(BaseModel):
     @classmethod
     def validate_results(cls, v: MilvusClient) -> MilvusClient:
         if not isinstance(v, MilvusClient):
-            error_message = f"The results from the `_init_client` method should be a `MilvusClient`, instead got `{type(v)}`."
-            logger.error(error_message)
-            raise TypeError(error_message)
-        return v
-
-
-class CreateFieldParams(BaseModel):
-    """
-    Parameters required for the `MilvusClientInit._create_field` method.
-
-    Attributes
-    ------------
-        collection_schema: CollectionSchema
-            The schema for a given collection (created with MilvusClient.create_schema).
-        params: dict
-            The field parameters to add to the schema (using schema.add_field).
-    """
-    collection_schema: Any
-    params: dict
-
-    @field_validator('collection_schema')
-    @classmethod
-    def validate_collection_schema(cls, v: CollectionSchema) -> CollectionSchema:
-        if not isinstance(v, CollectionSchema):
-            error_message = f"The argument `schema` should be a `CollectionSchema`, instead got `{type(v)}`."
-            logger.error(error_message)
-            raise TypeError(error_message)
-        return v
-
-    @field_validator('params')
-    @classmethod
-    def validate_params(cls, v: dict) -> dict:
-        if not isinstance(v, dict):
-            error_message = f"The argument `params` should be a dictionary, instead got `{type(v)}`."
-            logger.error(error_message)
-            raise TypeError(error_message)
-        return v
-
-
-class CreateIndexParams(BaseModel):
-    """
-    Parameters required for the `MilvusClientInit._create_index` method.
-
-    Attributes
-    ------------
-        index_params: IndexParams
-            The index parameters for a given collection (created with MilvusClient.prepare_index_params).
-        params: dict
-            The indices to add to the index_parameters (using index_params.add_index).
-    """
-    index_params: Any
-    params: dict
-
-    @field_validator('index_params')
-    @classmethod
-    def validate_index_params(cls, v: IndexParams) -> IndexParams:
-        if not isinstance(v, IndexParams):
-            error_message = f"The `index_params` argument should be an `IndexParams`, instead got {type(v)}."
-            logger.error(error_message)
-            raise TypeError(error_message)
-        return v
-
-    @field_validator('params')
-    @classmethod
-    def validate_params(cls, v: dict) -> dict:
-        if not isinstance(v, dict):
-            error_message = f"The `params` argument should be an dictionary, instead got {type(v)}."
-            logger.error(error_message)
-            raise TypeError(error_message)
+            raise TypeError(f"The results from the `_init_client` method should be a `MilvusClient`, instead got `{type(v)}`.")
         return v
 
 
@@ -148,22 +118,18 @@ class ListCollectionsResults(BaseModel):
 
     Attributes
     ------------
-        results: List[str | None]
+        results: List[str]
             The resulting list of all collections.
     """
-    results: List[str | None]
+    results: List[str]
 
     @field_validator('results')
     @classmethod
     def validate_results(cls, v: list) -> list:
         if not isinstance(v, list):
-            error_message = f"The results from the `list_collections` method should be a List[str | None], instead got {type(v)}."
-            logger.error(error_message)
-            raise TypeError(error_message)
-        if not all(isinstance(item, str) for item in v):
-            error_message = f"Each item in the collections list should be a string."
-            logger.error(error_message)
-            raise TypeError(error_message)
+            raise TypeError(f"The results from the `list_collections` method should be a List[str], instead got {type(v)}.")
+        if not all(map(isinstance, v, repeat(str))):
+            raise TypeError(f"Each item in the collections list should be a string.")
         return v
 
 
@@ -181,59 +147,37 @@ class CreateCollectionParams(BaseModel):
             The list of functions to add to the schema.
         index_params_list: List[dict]
             The list of indices to add to the index parameters
+        consistency_level: str
+            The default consistency level of searches on the collection.
     """
-    name: str
-    field_params_list: List[dict]
-    func_list: List[Any]
-    index_params_list: List[dict]
+    model_config = ConfigDict(strict=True)
 
-    @field_validator('name')
-    @classmethod
-    def validate_name(cls, v: str) -> str:
-        if not isinstance(v, str):
-            error_message = f"The `name` argument should be a string, instead got {type(v)}."
-            logger.error(error_message)
-            raise TypeError(error_message)
-        return v
-
-    @field_validator('field_params_list')
-    @classmethod
-    def validate_field_params_list(cls, v: list) -> list:
-        if not isinstance(v, list):
-            error_message = f"The `field_params_list` argument should be a List[dict], instead got {type(v)}."
-            logger.error(error_message)
-            raise TypeError(error_message)
-        if not all(isinstance(item, dict) for item in v):
-            error_message = f"Each item in `field_params_list` should be a dictionary."
-            logger.error(error_message)
-            raise TypeError(error_message)
-        return v
+    name: str
+    field_params_list: List[dict] | Tuple[dict, ...]
+    func_list: List[Any] | Tuple[Any, ...]
+    index_params_list: List[dict] | Tuple[dict, ...]
+    consistency_level: ConsistencyLevel
 
     @field_validator('func_list')
     @classmethod
     def validate_func_list(cls, v: list) -> list:
-        if not isinstance(v, list):
-            error_message = f"The `func_list` argument should be a `List[Function]`, instead got {type(v)}."
-            logger.error(error_message)
-            raise TypeError(error_message)
-        if not all(isinstance(item, Function) for item in v):
-            error_message = f"Each item in `func_list` should be a Function."
-            logger.error(error_message)
-            raise TypeError(error_message)
+        if not all(map(isinstance, v, repeat(Function))):
+            raise TypeError(f"Each item in `func_list` should be a Function.")
         return v
 
-    @field_validator('index_params_list')
-    @classmethod
-    def validate_index_params_list(cls, v: list) -> list:
-        if not isinstance(v, list):
-            error_message = f"The `index_params_list` argument should be a List[dict], instead got {type(v)}."
-            logger.error(error_message)
-            raise TypeError(error_message)
-        if not all(isinstance(item, dict) for item in v):
-            error_message = f"Each item in `index_params_list` should be a dictionary."
-            logger.error(error_message)
-            raise TypeError(error_message)
-        return v
+
+class HasCollectionParams(BaseModel):
+    """
+    Parameters required for the `MilvusClientInit.has_collection` method.
+
+    Attributes
+    ------------
+        name: str
+            The name of the collection to look up.
+    """
+    model_config = ConfigDict(strict=True)
+
+    name: str
 
 
 class DropCollectionParams(BaseModel):
@@ -245,16 +189,9 @@ class DropCollectionParams(BaseModel):
         name: str
             The name of the collection to drop.
     """
-    name: str
+    model_config = ConfigDict(strict=True)
 
-    @field_validator('name')
-    @classmethod
-    def validate_name(cls, v: str) -> str:
-        if not isinstance(v, str):
-            error_message = f"The `name` argument should be a string, instead got {type(v)}."
-            logger.error(error_message)
-            raise TypeError(error_message)
-        return v
+    name: str
 
 
 class InsertParams(BaseModel):
@@ -265,32 +202,36 @@ class InsertParams(BaseModel):
     ------------
         name: str
             The name of the collection to create.
-        data: List[dict]
-            The list of data to add to the collection.
+        data: List[dict] | Dict[str, list]
+            The rows of data to add to the collection, or the columns of data as lists of the same length.
+        wait_for_flush: bool
+            Whether to wait for the data to be flushed.
+        batch_size: int
+            The maximum number of rows to send in a single insert request.
+        deduplicate: bool
+            Whether to skip rows with the same text as an earlier row.
     """
-    name: str
-    data: List[dict]
+    model_config = ConfigDict(strict=True)
 
-    @field_validator('name')
-    @classmethod
-    def validate_name(cls, v: str) -> str:
-        if not isinstance(v, str):
-            error_message = f"The `name` argument should be a string, instead got {type(v)}."
-            logger.error(error_message)
-            raise TypeError(error_message)
-        return v
+    name: str
+    data: Any
+    wait_for_flush: bool
+    batch_size: PositiveInt
+    deduplicate: bool
 
     @field_validator('data')
     @classmethod
-    def validate_data(cls, v: list) -> list:
-        if not isinstance(v, list):
-            error_message = f"The `data` argument should be a `List[dict]`, instead got {type(v)}."
-            logger.error(error_message)
-            raise TypeError(error_message)
-        if not all(isinstance(item, dict) for item in v):
-            error_message = f"Each item in `data` should be a dictionary."
-            logger.error(error_message)
-            raise TypeError(error_message)
+    def validate_data(cls, v: list | dict) -> list | dict:
+        if isinstance(v, dict):
+            if not all(isinstance(key, str) and isinstance(column, list) for key, column in v.items()):
+                raise TypeError(f"Each column in `data` should be a list with a string key.")
+            if len(set(map(len, v.values()))) > 1:
+                raise ValueError(f"All columns in `data` should have the same length.")
+            return v
+        if not isinstance(v, (list, tuple)):
+            raise TypeError(f"The `data` argument should be a `List[dict]` or a `Dict[str, list]`, instead got {type(v)}.")
+        if not all(map(isinstance, v, repeat(dict))):
+            raise TypeError(f"Each item in `data` should be a dictionary.")
         return v
 
 
@@ -309,12 +250,33 @@ class InsertResults(BaseModel):
     @classmethod
     def validate_results(cls, v: dict) -> dict:
         if not isinstance(v, dict):
-            error_message = f"Results from the `insert` method should be a dictionary, instead got {type(v)}."
-            logger.error(error_message)
-            raise TypeError(error_message)
+            raise TypeError(f"Results from the `insert` method should be a dictionary, instead got {type(v)}.")
         return v
 
 
+class InsertFromJsonlParams(BaseModel):
+    """
+    Parameters required for the `MilvusClientInit.insert_from_jsonl` method.
+
+    Attributes
+    ------------
+        path: str
+            The path of the JSON Lines file with the data to insert.
+        name: str
+            The name of the collection to insert the data into.
+        batch_size: int
+            The maximum number of rows to send in a single insert request.
+        wait_for_flush: bool
+            Whether to wait for the data to be flushed.
+    """
+    model_config = ConfigDict(strict=True)
+
+    path: str
+    name: str
+    batch_size: PositiveInt
+    wait_for_flush: bool
+
+
 class DeleteParams(BaseModel):
     """
     Parameters required for the `MilvusClientInit.delete` method.
@@ -322,34 +284,17 @@ class DeleteParams(BaseModel):
     Attributes
     ------------
         name: str
-            The name of the collection to create.
+            The name of the collection to delete the data from.
         ids: List[str]
             The list of IDs to delete from the collection.
+        wait_for_flush: bool
+            Whether to wait for the deletion to be flushed.
     """
-    name: str
-    ids: List[str]
-
-    @field_validator('name')
-    @classmethod
-    def validate_name(cls, v: str) -> str:
-        if not isinstance(v, str):
-            error_message = f"The `name` argument should be a string, instead got {type(v)}."
-            logger.error(error_message)
-            raise TypeError(error_message)
-        return v
+    model_config = ConfigDict(strict=True)
 
-    @field_validator('ids')
-    @classmethod
-    def validate_data(cls, v: list) -> list:
-        if not isinstance(v, list):
-            error_message = f"The `data` argument should be a `List[str]`, instead got {type(v)}."
-            logger.error(error_message)
-            raise TypeError(error_message)
-        if not all(isinstance(item, str) for item in v):
-            error_message = f"Each item in `data` should be a string."
-            logger.error(error_message)
-            raise TypeError(error_message)
-        return v
+    name: str
+    ids: List[str] | Tuple[str, ...]
+    wait_for_flush: bool
 
 
 class FullTextSearchParams(BaseModel):
@@ -364,41 +309,15 @@ class FullTextSearchParams(BaseModel):
             The list of queries for which to do a search.
         limit: int
             The maximum number of results to obtain.
+        consistency_level: str
+            The consistency level of the search.
     """
+    model_config = ConfigDict(strict=True)
+
     name: str
-    query_list: List[str]
+    query_list: List[str] | Tuple[str, ...]
     limit: int
-
-    @field_validator('name')
-    @classmethod
-    def validate_name(cls, v: str) -> str:
-        if not isinstance(v, str):
-            error_message = f"The `name` argument should be a string, instead got {type(v)}."
-            logger.error(error_message)
-            raise TypeError(error_message)
-        return v
-
-    @field_validator('query_list')
-    @classmethod
-    def validate_query_list(cls, v: list) -> list:
-        if not isinstance(v, list):
-            error_message = f"The `query_list` argument should be a `List[str]`, instead got {type(v)}."
-            logger.error(error_message)
-            raise TypeError(error_message)
-        if not all(isinstance(item, str) for item in v):
-            error_message = f"Each item in `query_list` should be a string."
-            logger.error(error_message)
-            raise TypeError(error_message)
-        return v
-
-    @field_validator('limit')
-    @classmethod
-    def validate_limit(cls, v: int) -> int:
-        if not isinstance(v, int):
-            error_message = f"The `limit` argument should be an integer, instead got {type(v)}."
-            logger.error(error_message)
-            raise TypeError(error_message)
-        return v
+    consistency_level: ConsistencyLevel
 
 
 class FullTextSearchResults(BaseModel):
@@ -415,16 +334,34 @@ class FullTextSearchResults(BaseModel):
     @field_validator('results')
     def validate_results(cls, v):
         if not isinstance(v, SearchResult):
-            error_message = f"Full text search results should be a `SearchResult`, instead got {type(v)}."
-            logger.error(error_message)
-            raise TypeError(error_message)
-        if not all(isinstance(item, HybridHits) for item in v):
-            error_message = "Each item in the list of `results` should be a `HybridHits`."
-            logger.error(error_message)
-            raise TypeError(error_message)
+            raise TypeError(f"Full text search results should be a `SearchResult`, instead got {type(v)}.")
+        # Check each result and its hits in a single pass over the results
         for result in v:
-            if not all(isinstance(item, Hit) for item in result):
-                error_message = "Each item in the list of `result` should be a `Hit`."
-                logger.error(error_message)
-                raise TypeError(error_message)
-        return v
\ No newline at end of file
+            if not isinstance(result, HybridHits):
+                raise TypeError("Each item in the list of `results` should be a `HybridHits`.")
+            if not all(map(isinstance, result, repeat(Hit))):
+                raise TypeError("Each item in the list of `result` should be a `Hit`.")
+        return v
+
+
+class FullTextSearchBatchedParams(FullTextSearchParams):
+    """
+    Parameters required for the `MilvusClientInit.full_text_search_batched` method.
+
+    Attributes
+    ------------
+        name: str
+            The name of the collection to create.
+        query_list: List[str]
+            The list of queries for which to do a search.
+        limit: int
+            The maximum number of results to obtain.
+        consistency_level: str
+            The consistency level of the searches.
+        batch_size: int
+            The maximum number of queries to send in a single search request.
+        max_workers: int
+            The maximum number of search requests to send at the same time.
+    """
+    batch_size: PositiveInt
+    max_workers: PositiveInt